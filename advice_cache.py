@@ -0,0 +1,135 @@
+import hashlib
+import threading
+import time
+from typing import Dict, Optional
+
+from database import get_pool
+from migrations import migrate
+
+# 캐시 항목 유효 기간 (초, 기본 30일)
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# 최대 캐시 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def normalize_answer(answer: str) -> str:
+    """공백 차이만 있는 답변이 같은 키를 갖도록 답변을 정규화합니다."""
+    return " ".join(answer.split())
+
+
+def make_cache_key(question: str, answer: str, prompt_version: str, deployment_name: Optional[str]) -> str:
+    """(질문, 정규화된 답변, 프롬프트 버전, 배포 이름)의 SHA-256 해시를 반환합니다."""
+    parts = [question.strip(), normalize_answer(answer), prompt_version, deployment_name or ""]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class AdviceCache:
+    """AI 조언 응답을 SQLite에 저장하는 내용 주소 기반 캐시 클래스"""
+
+    def __init__(
+        self,
+        db_path: str = "questions.db",
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+            ttl_seconds: 캐시 항목 유효 기간 (초)
+            max_entries: 최대 캐시 항목 수
+        """
+        self.pool = get_pool(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+
+        with self.pool.connection() as conn:
+            migrate(conn)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 응답을 반환합니다. 없거나 만료되었으면 None을 반환합니다.
+
+        Args:
+            key: make_cache_key로 만든 캐시 키
+        """
+        now = time.time()
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT response FROM advice_cache WHERE key = ? AND created_at >= ?",
+                (key, now - self.ttl_seconds),
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE advice_cache SET last_accessed_at = ?, hit_count = hit_count + 1 WHERE key = ?",
+                    (now, key),
+                )
+
+        with self._counter_lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return row["response"] if row is not None else None
+
+    def put(self, key: str, response: str) -> None:
+        """
+        응답을 캐시에 저장하고 만료/초과 항목을 정리합니다.
+
+        Args:
+            key: make_cache_key로 만든 캐시 키
+            response: 저장할 AI 응답 텍스트
+        """
+        if not response:
+            return
+
+        now = time.time()
+        with self.pool.connection() as conn:
+            conn.execute('''
+                INSERT INTO advice_cache (key, response, created_at, last_accessed_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    response = excluded.response,
+                    created_at = excluded.created_at,
+                    last_accessed_at = excluded.last_accessed_at
+            ''', (key, response, now, now))
+            self._evict(conn, now)
+
+    def _evict(self, conn, now: float) -> None:
+        """만료된 항목을 지우고, 최대 개수를 넘는 만큼 LRU 순서로 제거합니다."""
+        conn.execute("DELETE FROM advice_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+
+        count = conn.execute("SELECT COUNT(*) FROM advice_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            conn.execute('''
+                DELETE FROM advice_cache
+                WHERE key IN (
+                    SELECT key FROM advice_cache
+                    ORDER BY last_accessed_at
+                    LIMIT ?
+                )
+            ''', (overflow,))
+
+    def stats(self) -> Dict:
+        """캐시 적중/미스 횟수와 저장된 항목 수를 반환합니다."""
+        with self.pool.connection() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM advice_cache").fetchone()[0]
+
+        with self._counter_lock:
+            hits, misses = self.hits, self.misses
+
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+            "entries": entries,
+        }
@@ -1,72 +1,180 @@
 import os
+import threading
+import httpx
 from dotenv import load_dotenv
+from langchain_core.messages import AIMessage
 from langchain_openai import AzureChatOpenAI
+from advice_cache import make_cache_key
+from instrumentation import metrics
+from mock_llm import MockChatModel
+from prompts import ADVISE_PROMPT_VERSION, build_advise_messages
 
 # .env 파일 로드
 load_dotenv()
 
+# 사용할 수 있는 LLM 백엔드 (LLM_BACKEND 환경 변수로 선택)
+LLM_BACKENDS = ("azure", "mock")
+
 class AzureOpenAIService:
-    def __init__(self):
+    def __init__(self, cache=None):
         self.api_key = os.getenv("AZURE_OPENAI_API_KEY")
         self.endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
         self.deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
         self.api_version = os.getenv("AZURE_OPENAI_API_VERSION")
 
-    def generate_text(self, prompt):
-        client = AzureChatOpenAI(
+        # azure: Azure OpenAI 호출, mock: 네트워크 없이 기록/합성 응답을 반환하는 로컬 백엔드
+        self.backend = os.getenv("LLM_BACKEND", "azure").lower()
+        if self.backend not in LLM_BACKENDS:
+            raise ValueError(f"지원하지 않는 LLM_BACKEND 입니다: {self.backend} (가능한 값: {', '.join(LLM_BACKENDS)})")
+
+        # HTTP 연결 풀 / 타임아웃 / 재시도 설정 (재시도는 SDK의 지수 백오프 사용)
+        self.timeout = float(os.getenv("AZURE_OPENAI_TIMEOUT", "60"))
+        self.max_retries = int(os.getenv("AZURE_OPENAI_MAX_RETRIES", "3"))
+        self.max_connections = int(os.getenv("AZURE_OPENAI_MAX_CONNECTIONS", "20"))
+        self.max_keepalive_connections = int(os.getenv("AZURE_OPENAI_MAX_KEEPALIVE_CONNECTIONS", "10"))
+        self.keepalive_expiry = float(os.getenv("AZURE_OPENAI_KEEPALIVE_EXPIRY", "60"))
+        # 스트리밍 응답의 토큰 사용량 요청 (stream_options, API 버전 2024-10-21 이상에서 지원)
+        # 조언은 주로 스트리밍으로 받으므로 기본으로 켜고, stream_options를 거부하는 이전 API 버전에서만 0으로 끔
+        self.stream_usage = os.getenv("AZURE_OPENAI_STREAM_USAGE", "1") == "1"
+
+        self._client = None
+        self._client_lock = threading.Lock()
+        # 동기 httpx.Client는 배치용 비동기 클라이언트를 만들 때도 새로 만들지 않고 공유
+        self._http_client = None
+        self._http_client_lock = threading.Lock()
+
+        # 조언 응답 캐시 (AdviceCache, 없으면 캐시 사용 안 함)
+        self.cache = cache
+
+    def _http_limits(self):
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def _get_http_client(self):
+        """프로세스 전체에서 공유하는 동기 httpx.Client(연결 풀)를 반환합니다."""
+        if self._http_client is None:
+            with self._http_client_lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(limits=self._http_limits(), timeout=self.timeout)
+        return self._http_client
+
+    def _create_client(self, http_async_client=None):
+        if self.backend == "mock":
+            return MockChatModel.from_env()
+
+        return AzureChatOpenAI(
             azure_endpoint=self.endpoint,
             azure_deployment=self.deployment_name,
             api_version=self.api_version,
-            api_key=self.api_key
+            api_key=self.api_key,
+            timeout=self.timeout,
+            max_retries=self.max_retries,
+            stream_usage=self.stream_usage,
+            http_client=self._get_http_client(),
+            http_async_client=http_async_client,
         )
-        return client.invoke(prompt)
 
-    def ask_advise(self, question, user_content):
-        prompt = f"""
-        당신은 오픽 IM 등급반의 영어 선생님 입니다. 
-        아래 학생이 작성한 영어 내용에 관해서 더 좋은 문구가 있으면 고쳐서 설명해주고, 추가 설명이 필요한 어휘를 설명해주세요.
-        
-        ## 오픽 질문
-        {question}
-
-        ## 학생 영어 내용 
-        {user_content}
-
-        ## 출력 방식
-        1. 기존 학생문단 전체를 수정한 버전으로 출력해주세요.
-        2. 수정한 문장을 정리하고 추가 어휘 내용이 필요한 내용이 있으면 작성해주세요.
-           - 수정 전, 후의 문장 다 표현해주세요.
-           - 수정한 문장을 따로 아래에 정리해주시고 그 문장아래에 추가 어휘 내용이 필요한 내용이 있으면 작성해주세요.
-           - 추가적으로 한국인들이 발음이 자주 틀릴만한 유의해야하는 것이 있으면 한국어로 읽을때는 어떤점을 유의해야하는지도 작성해주세요.
-
-        ## 주의 사항
-        - 결과만 출력해 주세요. 가벼운 답변은 포함할 필요 없습니다.
-        - 마크다운 형식으로 작성해주세요. 가장 큰 글씨는 ### 기준으로 작성해주세요.
-        - 1과 2 사이에만 구분선 추가해주세요. 다른곳은 추가 하지 않아도 됩니다.
-
-        ## 여기서부터 아래는 모두 출력 샘플입니다.
-        ### 1. 학생 문단 전체 수정본
-        I remember a trip I took to Jeju Island when I was about 13 years old. I went there with my family, and we all loved it. Jeju Island was a very popular destination back then. We especially enjoyed visiting its many beautiful spots, such as the beaches and scenic landscapes. Overall, it was a very memorable experience for me.
-
-        ---
-
-        ### 2. 수정 문장 및 어휘 설명
-        #### 1. "I remember a trip I took to Jeju Island when I was about 13 years old."
-        - 수정 전: "uhm.. I remember when I went to Jeju Island."
-        - 수정 후: "I remember a trip I took to Jeju Island when I was about 13 years old."
-
-        **어휘 설명:**  
-        - "uhm.."은 되도록 생략하거나, "Well,"로 대체하는 것이 좋습니다.
-        - "I remember a trip I took to Jeju Island"는 좀 더 자연스럽고 명확한 표현입니다.
-        - "when I was about 13 years old"에서 about(약)이 더 자연스러우며, maybe(아마)는 나이 앞에서는 어색할 수 있습니다.
-
-        **발음 주의:**  
-        - Jeju Island에서 ‘Island’의 s는 무금입니다. [ˈaɪ.lənd]
-        - "trip"은 [trɪp], ‘트립’이 아니라 ‘춉’에 더 가깝게 들립니다.
-
-        ---
+    def create_async_http_client(self):
+        """
+        비동기 배치 작업용 httpx.AsyncClient를 만듭니다.
+
+        비동기 연결 풀은 이벤트 루프에 묶이므로 배치(이벤트 루프)마다 새로 만들어 사용하고 닫아야 합니다.
         """
-        return self.generate_text(prompt)
+        return httpx.AsyncClient(limits=self._http_limits(), timeout=self.timeout)
+
+    def create_async_client(self, http_async_client):
+        """주어진 httpx.AsyncClient를 사용하는 비동기 호출용 클라이언트를 만듭니다."""
+        return self._create_client(http_async_client=http_async_client)
+
+    def _get_client(self):
+        """처음 호출될 때 클라이언트를 만들고, 이후에는 같은 클라이언트(연결 풀)를 재사용합니다."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    def generate_text(self, prompt):
+        client = self._get_client()
+        with metrics.track_ai_call("invoke") as call:
+            result = client.invoke(prompt)
+            call.set_usage(getattr(result, "usage_metadata", None))
+        return result
+
+    def generate_text_stream(self, prompt):
+        """응답을 생성되는 대로 텍스트 조각(str) 단위로 yield 합니다."""
+        client = self._get_client()
+        with metrics.track_ai_call("stream") as call:
+            for chunk in client.stream(prompt):
+                # 토큰 사용량은 마지막(내용이 빈) 조각에 담겨 옴
+                call.set_usage(getattr(chunk, "usage_metadata", None))
+                if chunk.content:
+                    call.mark_first_token()
+                    yield chunk.content
+
+    def _advise_cache_key(self, question, user_content):
+        return make_cache_key(question, user_content, ADVISE_PROMPT_VERSION, self.deployment_name)
+
+    def ask_advise(self, question, user_content):
+        if self.cache is None:
+            return self.generate_text(self._build_advise_prompt(question, user_content))
+
+        key = self._advise_cache_key(question, user_content)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return AIMessage(content=cached)
+
+        result = self.generate_text(self._build_advise_prompt(question, user_content))
+        self.cache.put(key, result.content)
+        return result
+
+    def ask_advise_stream(self, question, user_content):
+        """ask_advise의 스트리밍 버전. 조언 마크다운을 조각 단위로 yield 합니다."""
+        if self.cache is None:
+            yield from self.generate_text_stream(self._build_advise_prompt(question, user_content))
+            return
+
+        key = self._advise_cache_key(question, user_content)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        for chunk in self.generate_text_stream(self._build_advise_prompt(question, user_content)):
+            chunks.append(chunk)
+            yield chunk
+        # 스트림이 끝까지 완료된 경우에만 캐시에 저장
+        self.cache.put(key, "".join(chunks))
+
+    async def generate_text_async(self, prompt, client=None):
+        client = client or self._get_client()
+        with metrics.track_ai_call("async") as call:
+            result = await client.ainvoke(prompt)
+            call.set_usage(getattr(result, "usage_metadata", None))
+        return result
+
+    async def ask_advise_async(self, question, user_content, client=None):
+        """ask_advise의 비동기 버전. 배치 작업에서는 create_async_client로 만든 client를 전달합니다."""
+        if self.cache is None:
+            return await self.generate_text_async(self._build_advise_prompt(question, user_content), client)
+
+        key = self._advise_cache_key(question, user_content)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return AIMessage(content=cached)
+
+        result = await self.generate_text_async(self._build_advise_prompt(question, user_content), client)
+        self.cache.put(key, result.content)
+        return result
+
+    def _build_advise_prompt(self, question, user_content):
+        """고정된 시스템 메시지(지시사항과 출력 샘플) + 질문/답변만 담은 사용자 메시지를 만듭니다."""
+        return build_advise_messages(question, user_content)
+
 
 def main():
     service = AzureOpenAIService()
@@ -0,0 +1,34 @@
+import re
+from dataclasses import dataclass
+
+# 단어 (영문자와 아포스트로피), 문장 구분 기호
+_WORD_PATTERN = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)*")
+_SENTENCE_PATTERN = re.compile(r"[^.!?\n]*[A-Za-z][^.!?\n]*")
+
+# 군말로 셀 단어 (소문자, "uhm.." 같은 표기는 단어 추출 후 비교)
+FILLER_WORDS = frozenset({"uh", "uhm", "um", "umm", "hmm", "er", "erm", "ah", "eh"})
+
+
+@dataclass
+class AnswerFeatures:
+    """답변 하나의 텍스트 분석 결과"""
+
+    word_count: int
+    unique_word_count: int
+    sentence_count: int
+    filler_count: int
+
+
+def extract_features(text: str) -> AnswerFeatures:
+    """
+    답변을 한 번 토큰화해 단어 수, 고유 단어 수, 문장 수, 군말 수를 계산합니다.
+
+    단어는 대소문자를 구분하지 않으며, 문장은 마침표/물음표/느낌표/줄바꿈으로 나눕니다.
+    """
+    words = [word.lower() for word in _WORD_PATTERN.findall(text)]
+    return AnswerFeatures(
+        word_count=len(words),
+        unique_word_count=len(set(words)),
+        sentence_count=len(_SENTENCE_PATTERN.findall(text)),
+        filler_count=sum(1 for word in words if word in FILLER_WORDS),
+    )
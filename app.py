@@ -1,18 +1,47 @@
 import streamlit as st
 import sqlite3
 import random
+from datetime import datetime, timezone
 from typing import List, Dict, Optional
 from repository import QuestionRepository
 from ai_service import AzureOpenAIService
+from advice_cache import AdviceCache
+from draft_writer import DraftWriter
+from scheduler import TIMESTAMP_FORMAT
+from debug_panel import begin_instrumented_run, render_debug_panel
 
 # 데이터베이스 파일 경로
 DB_PATH = "questions.db"
 
-# Repository 인스턴스 생성
-question_repository = QuestionRepository(DB_PATH)
+# 한 번의 연습 세션에서 풀 질문 수
+PRACTICE_SESSION_SIZE = 20
+
+# 이번 실행(rerun)의 쿼리/AI 호출 기록 시작
+run_stats = begin_instrumented_run()
+
+@st.cache_resource
+def get_question_repository() -> QuestionRepository:
+    """서버 프로세스 전체에서 공유되는 Repository 인스턴스를 반환합니다."""
+    return QuestionRepository(DB_PATH)
+
+# Repository 인스턴스 (연결 풀 공유)
+question_repository = get_question_repository()
+
+@st.cache_resource
+def get_ai_service() -> AzureOpenAIService:
+    """서버 프로세스 전체에서 클라이언트(HTTP 연결 풀)와 응답 캐시를 공유하는 AI 서비스를 반환합니다."""
+    return AzureOpenAIService(cache=AdviceCache(DB_PATH))
 
 # ai
-ai_service = AzureOpenAIService()
+ai_service = get_ai_service()
+
+@st.cache_resource
+def get_draft_writer() -> DraftWriter:
+    """서버 프로세스 전체에서 공유되는 답변 초안 백그라운드 저장기를 반환합니다."""
+    return DraftWriter(question_repository)
+
+# 답변 초안 저장기
+draft_writer = get_draft_writer()
 
 # 페이지 설정
 st.set_page_config(
@@ -21,184 +50,243 @@ st.set_page_config(
     layout="wide"
 )
 
-def filter_questions_by_max_answer_count(questions: List[Dict]) -> List[Dict]:
-    """답변 개수가 최대값과 같은 질문들을 제외한 질문 리스트를 반환합니다."""
-    if not questions:
-        return questions
+def start_practice_session(shuffle: bool, session_id: Optional[str] = None) -> str:
+    """
+    복습 예정 시각(SM-2 일정)이 가장 이른 질문들로 연습 세션을 구성해 저장합니다.
+    
+    세션 ID는 URL 쿼리 파라미터(session)에 기록되어 새로고침이나 서버 재시작 후에도 이어서 풀 수 있습니다.
+    다른 페이지를 다녀와 쿼리 파라미터가 사라져도 이어서 풀 수 있도록 세션 상태에도 보관합니다.
+    """
+    question_ids = [question["id"] for question in question_repository.get_due_questions(PRACTICE_SESSION_SIZE)]
+    
+    if shuffle:
+        random.shuffle(question_ids)
+    
+    session_id = question_repository.start_practice_session(question_ids, shuffle, session_id=session_id)
+    st.query_params["session"] = session_id
+    st.session_state.practice_session_id = session_id
+    return session_id
+
+def format_local_time(timestamp: str) -> str:
+    """SQLite에 UTC로 저장된 시각을 현지 시간 문자열로 바꿉니다."""
+    utc_time = datetime.strptime(timestamp, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+    return utc_time.astimezone().strftime("%Y-%m-%d %H:%M")
+
+DIFFICULTY_LABELS = {
+    1: "매우 쉬움",
+    2: "쉬움",
+    3: "보통",
+    4: "어려움",
+    5: "매우 어려움"
+}
+
+def save_draft(session_id: str, question_id: int, answer_key: str, difficulty_key: str):
+    """
+    답변/난이도가 바뀌면 초안을 백그라운드 저장 대기열에 넣습니다 (입력 처리 중 DB 쓰기 없음).
+    
+    text_area의 on_change는 포커스가 빠지거나 Ctrl+Enter를 누를 때만 호출되므로,
+    그 사이에 새로고침하면 아직 서버로 보내지 않은 입력은 초안에 남지 않습니다.
+    """
+    draft_writer.submit(
+        session_id,
+        question_id,
+        st.session_state.get(answer_key, ""),
+        st.session_state.get(difficulty_key, 3),
+    )
+
+@st.fragment
+def render_answer_input(session_id: str, question_id: int, answer_key: str, difficulty_key: str):
+    """답변 입력 영역. 입력 시 이 영역만 다시 실행됩니다."""
+    st.subheader("💬 답변 작성")
+    
+    if answer_key not in st.session_state:
+        st.session_state[answer_key] = ""
     
-    # 각 질문의 답변 개수 계산
-    question_answer_counts = {}
-    max_count = 0
+    st.text_area(
+        "답변을 입력하세요:",
+        value=st.session_state[answer_key],
+        height=300,
+        placeholder="여기에 답변을 타이핑하세요...",
+        help="입력란 밖을 클릭하거나 Ctrl+Enter를 누르면 초안이 저장됩니다.",
+        key=answer_key,
+        on_change=save_draft,
+        args=(session_id, question_id, answer_key, difficulty_key),
+    )
+
+@st.fragment
+def render_difficulty_input(session_id: str, question_id: int, answer_key: str, difficulty_key: str):
+    """난이도 선택 영역. 슬라이더를 움직이면 이 영역만 다시 실행됩니다."""
+    st.subheader("📊 난이도 선택")
     
-    for question in questions:
-        count = question_repository.get_question_answer_count(question["id"])
-        question_answer_counts[question["id"]] = count
-        max_count = max(max_count, count)
+    if difficulty_key not in st.session_state:
+        st.session_state[difficulty_key] = 3
     
-    # 최대 답변 개수가 0이면 모든 질문 반환 (답변이 없는 경우)
-    if max_count == 0:
-        return questions
+    difficulty = st.slider(
+        "난이도 (1: 매우 쉬움 ~ 5: 매우 어려움)",
+        min_value=1,
+        max_value=5,
+        value=st.session_state[difficulty_key],
+        key=difficulty_key,
+        on_change=save_draft,
+        args=(session_id, question_id, answer_key, difficulty_key),
+    )
     
-    # 최대 답변 개수와 다른 질문들만 필터링
-    filtered_questions = [
-        question for question in questions
-        if question_answer_counts[question["id"]] < max_count
-    ]
+    st.caption(f"선택한 난이도: {difficulty} ({DIFFICULTY_LABELS[difficulty]})")
+
+@st.fragment
+def render_advice_and_save(session_id: str, current_question: Dict, position: int, answer_key: str, difficulty_key: str):
+    """
+    조언 요청 / 저장 버튼과 조언 영역.
+
+    조언 요청은 이 영역만 다시 실행하고, 저장 후 다음 질문으로 이동할 때만 앱 전체를 다시 실행합니다.
+    답변과 난이도는 다른 fragment의 위젯 값을 세션 상태에서 읽습니다.
+    """
+    answer = st.session_state.get(answer_key, "")
+    difficulty = st.session_state.get(difficulty_key, 3)
     
-    return filtered_questions
+    col1, col2, col3 = st.columns([1, 1, 1])
+    advice_requested = False
+    with col1:
+        if st.button("오픽 선생님 조언 받기", type="primary", use_container_width=True):
+            advice_requested = True
+
+    with col3:
+        if st.button("저장 후 다음 ▶️", type="primary", use_container_width=True):
+            # 답변 저장
+            if answer.strip():
+                # 저장 전에 같은 질문의 이전 답변 중 거의 같은 답변이 있는지 확인 (LSH 버킷 조회)
+                similar_answers = question_repository.find_similar_answers(current_question["id"], answer)
+                if question_repository.save_answer(current_question["id"], answer, difficulty):
+                    if similar_answers:
+                        st.session_state.duplicate_answer_notice = (
+                            f"이전 답변과 거의 같은 답변입니다 (유사도 {similar_answers[0]['similarity']:.0%}). "
+                            "'질문 관리' 페이지의 중복 답변 정리에서 합칠 수 있습니다."
+                        )
+                    question_repository.set_practice_session_cursor(session_id, position + 1)
+                    draft_writer.discard(session_id, current_question["id"])
+                    # 다음 질문 표시를 위해 앱 전체 다시 실행
+                    st.rerun(scope="app")
+                else:
+                    st.error("답변 저장 중 오류가 발생했습니다.")
+            else:
+                st.warning("답변을 입력해주세요.")
+
+    # 조언은 (답변 텍스트, 조언) 형태로 세션에 보관해 재실행 후에도 유지
+    advice_key = f"advice_{current_question['id']}_{position}"
+    if advice_requested:
+        st.subheader("💬 오픽 선생님 조언")
+        # 생성되는 대로 바로 표시하고, 전체 텍스트는 반환값으로 받음
+        ai_result = st.write_stream(
+            ai_service.ask_advise_stream(current_question["question"], answer)
+        )
+        st.session_state[advice_key] = (answer, ai_result)
+        print(ai_result)
+    elif advice_key in st.session_state:
+        advised_answer, ai_result = st.session_state[advice_key]
+        st.subheader("💬 오픽 선생님 조언")
+        if advised_answer != answer:
+            st.caption("답변이 수정되었습니다. 아래 조언은 수정 전 답변에 대한 내용입니다.")
+        st.markdown(f"{ai_result}")
 
 def main():
     st.title("❓ 문제 풀기")
     st.markdown("---")
     
+    # 직전에 저장한 답변이 이전 답변과 거의 같았으면 알림
+    if "duplicate_answer_notice" in st.session_state:
+        st.toast(st.session_state.pop("duplicate_answer_notice"), icon="♻️")
+    
+    # AI 조언 캐시 적중/미스 현황
+    if ai_service.cache is not None:
+        cache_stats = ai_service.cache.stats()
+        st.sidebar.caption(
+            f"AI 조언 캐시: 적중 {cache_stats['hits']} / 미스 {cache_stats['misses']} "
+            f"(저장 {cache_stats['entries']}개)"
+        )
+    
     try:
-        all_questions = question_repository.get_all_questions()
-        
-        if not all_questions:
-            st.warning("데이터베이스에 질문이 없습니다. '질문 관리' 페이지에서 질문을 추가하세요.")
-            return
+        # 연습 세션 (질문 ID 목록과 진행 위치는 SQLite에 저장)
+        # 다른 페이지를 다녀오면 쿼리 파라미터가 사라지므로 이 브라우저 세션 상태에 둔 ID로 이어서 풂
+        # (다른 사용자의 세션을 이어받지 않도록 브라우저에 기록된 ID만 사용)
+        session_id = st.query_params.get("session") or st.session_state.get("practice_session_id")
+        session = question_repository.get_practice_session(session_id) if session_id else None
         
-        # 답변 개수가 최대값과 같은 질문들을 제외
-        filtered_questions = filter_questions_by_max_answer_count(all_questions)
-        
-        if not filtered_questions:
-            st.warning("모든 질문이 최대 답변 개수를 가지고 있어 표시할 질문이 없습니다.")
-            return
+        # 질문 셔플 여부 선택 (처음에는 저장된 세션의 설정을 따름)
+        if "shuffle_questions" not in st.session_state:
+            st.session_state.shuffle_questions = session["shuffle"] if session else True
+        shuffle_questions = st.checkbox("질문 순서를 랜덤으로 섞기", key="shuffle_questions")
         
-        # 질문 셔플 여부 선택
-        shuffle_questions = st.checkbox(
-            "질문 순서를 랜덤으로 섞기",
-            value=st.session_state.get("shuffle_questions", True),
-        )
-        st.session_state.shuffle_questions = shuffle_questions
+        # 세션이 없거나 셔플 옵션이 바뀌었거나, 복습할 질문이 없을 때 만든 빈 세션이면 새 순서로 세션 구성
+        if session is None or session["shuffle"] != shuffle_questions or not session["question_ids"]:
+            session_id = start_practice_session(shuffle_questions, session_id)
+            session = question_repository.get_practice_session(session_id)
+        else:
+            st.query_params["session"] = session_id
+            st.session_state.practice_session_id = session_id
         
-        # 세션 상태 초기화 (셔플 옵션 변경 시에도 초기화)
-        need_init = (
-            "shuffled_questions" not in st.session_state
-            or "current_index" not in st.session_state
-            or st.session_state.get("last_shuffle_option") != shuffle_questions
-            or st.session_state.get("last_filtered_questions_count") != len(filtered_questions)
-        )
-        if need_init:
-            if shuffle_questions:
-                st.session_state.shuffled_questions = random.sample(filtered_questions, len(filtered_questions))
+        question_ids = session["question_ids"]
+        if not question_ids:
+            next_due_at = question_repository.get_next_due_at()
+            if next_due_at is None:
+                st.warning("데이터베이스에 질문이 없습니다. '질문 관리' 페이지에서 질문을 추가하세요.")
             else:
-                # 셔플하지 않고 등록된 순서대로 사용
-                st.session_state.shuffled_questions = filtered_questions[:]
-            st.session_state.current_index = 0
-            st.session_state.last_shuffle_option = shuffle_questions
-            st.session_state.last_filtered_questions_count = len(filtered_questions)
+                # 복습 예정 시각이 아직 지나지 않은 질문은 미리 풀지 않음
+                st.success("🎉 지금 복습할 질문이 없습니다!")
+                st.caption(f"다음 복습 예정: {format_local_time(next_due_at)}")
+            return
         
-        questions = st.session_state.shuffled_questions
-        current_idx = st.session_state.current_index
+        # 세션 구성 후 삭제된 질문은 건너뜀
+        position = session["cursor"]
+        current_question = None
+        while position < len(question_ids):
+            current_question = question_repository.get_question(question_ids[position])
+            if current_question is not None:
+                break
+            position += 1
+        if position != session["cursor"]:
+            question_repository.set_practice_session_cursor(session_id, position)
         
-        if current_idx < len(questions):
-            current_question = questions[current_idx]
-            
+        if position < len(question_ids):
             # 진행 상황 표시
-            progress = (current_idx + 1) / len(questions)
+            progress = (position + 1) / len(question_ids)
             st.progress(progress)
-            st.caption(f"진행률: {current_idx + 1} / {len(questions)} ({int(progress * 100)}%)")
+            st.caption(f"진행률: {position + 1} / {len(question_ids)} ({int(progress * 100)}%)")
             
             st.markdown("---")
             
             # 질문 표시
-            st.subheader(f"질문 {current_idx + 1}")
+            st.subheader(f"질문 {position + 1}")
             st.info(f"**{current_question['question']}**")
             
             st.markdown("---")
             
-            # 답변 입력 영역
-            st.subheader("💬 답변 작성")
+            # 답변 입력 / 난이도 선택 / 조언·저장은 각각 독립된 fragment로 실행되어
+            # 입력 중에는 해당 영역만 다시 실행되고, 질문 목록 로드는 이동/셔플 변경 시에만 일어남
+            answer_key = f"answer_{current_question['id']}_{position}"
+            difficulty_key = f"difficulty_{current_question['id']}_{position}"
             
-            # 답변 텍스트 박스
-            answer_key = f"answer_{current_question['id']}_{current_idx}"
+            # 새로고침 등으로 세션 상태가 비어 있으면 저장된 초안으로 복원
             if answer_key not in st.session_state:
-                st.session_state[answer_key] = ""
+                draft = question_repository.get_draft(session_id, current_question["id"])
+                if draft is not None:
+                    st.session_state[answer_key] = draft["answer"]
+                    st.session_state[difficulty_key] = draft["difficulty"]
             
-            answer = st.text_area(
-                "답변을 입력하세요:",
-                value=st.session_state[answer_key],
-                height=300,
-                placeholder="여기에 답변을 타이핑하세요...",
-                key=answer_key
-            )
-            
-            # 난이도 선택
-            st.subheader("📊 난이도 선택")
-            difficulty_key = f"difficulty_{current_question['id']}_{current_idx}"
-            if difficulty_key not in st.session_state:
-                st.session_state[difficulty_key] = 3
-            
-            difficulty = st.slider(
-                "난이도 (1: 매우 쉬움 ~ 5: 매우 어려움)",
-                min_value=1,
-                max_value=5,
-                value=st.session_state[difficulty_key],
-                key=difficulty_key
-            )
-            
-            # 난이도 설명
-            difficulty_labels = {
-                1: "매우 쉬움",
-                2: "쉬움",
-                3: "보통",
-                4: "어려움",
-                5: "매우 어려움"
-            }
-            st.caption(f"선택한 난이도: {difficulty} ({difficulty_labels[difficulty]})")
+            draft_args = (session_id, current_question["id"], answer_key, difficulty_key)
+            render_answer_input(*draft_args)
+            render_difficulty_input(*draft_args)
             
             st.markdown("---")
             
-            # 다음 버튼
-            col1, col2, col3 = st.columns([1, 1, 1])
-            ai_result = ""
-            with col1:
-                if st.button("오픽 선생님 조언 받기", type="primary", use_container_width=True):
-                    ai_result = ai_service.ask_advise(current_question["question"], answer).content
-
-            with col3:
-                if st.button("저장 후 다음 ▶️", type="primary", use_container_width=True):
-                    # 답변 저장
-                    if answer.strip():
-                        if question_repository.save_answer(current_question["id"], answer, difficulty):
-                            st.session_state.current_index = current_idx + 1
-                            # 다음 질문을 위해 세션 상태 초기화
-                            if current_idx + 1 < len(questions):
-                                next_question = questions[current_idx + 1]
-                                next_answer_key = f"answer_{next_question['id']}_{current_idx + 1}"
-                                next_difficulty_key = f"difficulty_{next_question['id']}_{current_idx + 1}"
-                                if next_answer_key not in st.session_state:
-                                    st.session_state[next_answer_key] = ""
-                                if next_difficulty_key not in st.session_state:
-                                    st.session_state[next_difficulty_key] = 3
-                            
-                            st.rerun()
-                        else:
-                            st.error("답변 저장 중 오류가 발생했습니다.")
-                    else:
-                        st.warning("답변을 입력해주세요.")
-
-            if ai_result:
-                st.subheader("💬 오픽 선생님 조언")
-                st.markdown(f"{ai_result}")
-                print(ai_result)
+            render_advice_and_save(session_id, current_question, position, answer_key, difficulty_key)
         
         else:
             st.success("🎉 모든 문제를 완료했습니다!")
             st.balloons()
             
             if st.button("🔄 다시 시작"):
-                # 다시 시작 시에도 현재 셔플 옵션과 필터링을 반영
-                filtered_questions = filter_questions_by_max_answer_count(all_questions)
-                shuffle_questions = st.session_state.get("shuffle_questions", True)
-                if shuffle_questions:
-                    st.session_state.shuffled_questions = random.sample(filtered_questions, len(filtered_questions))
-                else:
-                    st.session_state.shuffled_questions = filtered_questions[:]
-                st.session_state.current_index = 0
-                st.session_state.last_shuffle_option = shuffle_questions
-                st.session_state.last_filtered_questions_count = len(filtered_questions)
+                # 다시 시작 시 갱신된 복습 일정으로 다음 세션 구성
+                start_practice_session(shuffle_questions, session_id)
                 st.rerun()
     
     except sqlite3.OperationalError:
@@ -208,3 +296,4 @@ def main():
 
 if __name__ == "__main__":
     main()
+    render_debug_panel(run_stats)
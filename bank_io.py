@@ -0,0 +1,134 @@
+import argparse
+import csv
+import json
+import os
+from typing import Dict, IO, Iterable, Iterator, Optional, Tuple
+
+from repository import QuestionRepository
+
+# 지원하는 파일 형식
+FORMATS = ("csv", "jsonl")
+
+# 내보내기 컬럼 순서
+QUESTION_FIELDS = ["id", "question", "type", "created_at"]
+ANSWER_FIELDS = ["answer_id", "question_id", "question", "type", "answer", "difficulty", "created_at", "advice"]
+
+
+def detect_format(path: str) -> str:
+    """파일 확장자로 형식(csv/jsonl)을 판단합니다."""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "json":
+        extension = "jsonl"
+    if extension not in FORMATS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {path} (csv 또는 jsonl)")
+    return extension
+
+
+def read_questions(f: IO[str], fmt: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    질문 파일을 한 행씩 읽어 (질문 내용, 질문 유형)을 반환합니다.
+
+    CSV는 question(필수), type(선택) 헤더가 필요하고,
+    JSONL은 각 줄이 {"question": ..., "type": ...} 형식이어야 합니다.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or "question" not in reader.fieldnames:
+            raise ValueError("CSV 파일에 question 컬럼이 필요합니다.")
+        for row in reader:
+            yield row.get("question") or "", row.get("type") or None
+    else:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{line_number}번째 줄의 JSON 형식이 올바르지 않습니다: {e}") from e
+            if not isinstance(record, dict):
+                raise ValueError(f"{line_number}번째 줄은 {{\"question\": ..., \"type\": ...}} 형식의 객체여야 합니다.")
+            question = record.get("question")
+            question_type = record.get("type")
+            if question is not None and not isinstance(question, str):
+                raise ValueError(f"{line_number}번째 줄의 question은 문자열이어야 합니다.")
+            if question_type is not None and not isinstance(question_type, str):
+                raise ValueError(f"{line_number}번째 줄의 type은 문자열이어야 합니다.")
+            yield question or "", question_type or None
+
+
+def write_rows(rows: Iterable[Dict], f: IO[str], fmt: str, fields) -> int:
+    """
+    행을 한 줄씩 파일에 기록합니다.
+
+    Returns:
+        기록한 행 수
+    """
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def import_questions_file(repository: QuestionRepository, path: str, batch_size: int = 1000) -> Dict[str, int]:
+    """질문 파일(csv/jsonl)을 스트리밍으로 가져옵니다."""
+    fmt = detect_format(path)
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return repository.import_questions(read_questions(f, fmt), batch_size=batch_size)
+
+
+def export_questions_file(repository: QuestionRepository, path: str) -> int:
+    """모든 질문을 파일(csv/jsonl)로 내보냅니다."""
+    fmt = detect_format(path)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        return write_rows(repository.iter_questions(), f, fmt, QUESTION_FIELDS)
+
+
+def export_answers_file(repository: QuestionRepository, path: str) -> int:
+    """모든 답변 기록을 파일(csv/jsonl)로 내보냅니다."""
+    fmt = detect_format(path)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        return write_rows(repository.iter_answer_history(), f, fmt, ANSWER_FIELDS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="질문 은행 가져오기/내보내기 (CSV/JSONL)")
+    parser.add_argument("--db", default="questions.db", help="데이터베이스 파일 경로")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="질문 파일 가져오기")
+    import_parser.add_argument("path", help="질문 파일 경로 (.csv 또는 .jsonl)")
+    import_parser.add_argument("--batch-size", type=int, default=1000, help="executemany 배치 크기")
+
+    export_questions_parser = subparsers.add_parser("export-questions", help="질문 내보내기")
+    export_questions_parser.add_argument("path", help="저장할 파일 경로 (.csv 또는 .jsonl)")
+
+    export_answers_parser = subparsers.add_parser("export-answers", help="답변 기록 내보내기")
+    export_answers_parser.add_argument("path", help="저장할 파일 경로 (.csv 또는 .jsonl)")
+
+    args = parser.parse_args()
+    repository = QuestionRepository(args.db)
+
+    if args.command == "import":
+        result = import_questions_file(repository, args.path, batch_size=args.batch_size)
+        print(
+            f"가져오기 완료: 추가 {result['inserted']}개, "
+            f"중복 {result['duplicates']}개, 빈 질문 {result['skipped']}개"
+        )
+    elif args.command == "export-questions":
+        count = export_questions_file(repository, args.path)
+        print(f"{count}개의 질문을 {args.path}에 저장했습니다.")
+    else:
+        count = export_answers_file(repository, args.path)
+        print(f"{count}개의 답변을 {args.path}에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()
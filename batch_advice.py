@@ -0,0 +1,172 @@
+import argparse
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional
+
+from repository import QuestionRepository
+
+# 동시에 진행할 최대 요청 수
+DEFAULT_CONCURRENCY = 4
+
+# 분당 최대 요청 수 (Azure 배포의 RPM 한도에 맞춰 조정)
+DEFAULT_REQUESTS_PER_MINUTE = 60
+
+
+class RateLimiter:
+    """요청 시작 간격을 일정하게 유지하는 비동기 속도 제한기"""
+
+    def __init__(self, requests_per_minute: int):
+        """
+        속도 제한기 초기화
+
+        Args:
+            requests_per_minute: 분당 최대 요청 수 (0 이하이면 제한 없음)
+        """
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """다음 요청을 시작해도 될 때까지 기다립니다."""
+        if self.interval <= 0:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def generate_advice_batch(
+    ai_service,
+    answers: List[Dict],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+    on_result: Optional[Callable[[Dict], None]] = None,
+) -> List[Dict]:
+    """
+    여러 답변의 AI 조언을 동시에 생성합니다.
+
+    Args:
+        ai_service: AzureOpenAIService 인스턴스
+        answers: get_answers_for_advice가 반환한 답변 목록
+        concurrency: 동시에 진행할 최대 요청 수
+        requests_per_minute: 분당 최대 요청 수
+        on_result: 답변 하나가 끝날 때마다 결과와 함께 호출되는 콜백
+
+    Returns:
+        answer_id, advice, error 딕셔너리 리스트 (완료 순서)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    rate_limiter = RateLimiter(requests_per_minute)
+    results = []
+
+    async with ai_service.create_async_http_client() as http_client:
+        client = ai_service.create_async_client(http_client)
+
+        async def advise(item: Dict) -> Dict:
+            async with semaphore:
+                await rate_limiter.wait()
+                try:
+                    message = await ai_service.ask_advise_async(item["question"], item["answer"], client)
+                    return {"answer_id": item["answer_id"], "advice": message.content, "error": None}
+                except Exception as e:
+                    # 한 답변의 실패가 전체 배치를 중단시키지 않도록 결과로 기록
+                    return {"answer_id": item["answer_id"], "advice": None, "error": str(e)}
+
+        for task in asyncio.as_completed([advise(item) for item in answers]):
+            result = await task
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+    return results
+
+
+def run_advice_batch(
+    repository: QuestionRepository,
+    ai_service,
+    question_id: Optional[int] = None,
+    only_missing: bool = True,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> Dict:
+    """
+    대상 답변을 조회해 AI 조언을 일괄 생성하고, 완료되는 대로 답변에 저장합니다.
+
+    Args:
+        repository: QuestionRepository 인스턴스
+        ai_service: AzureOpenAIService 인스턴스
+        question_id: 질문 ID (None이면 모든 질문)
+        only_missing: True이면 아직 조언이 없는 답변만 처리
+        concurrency: 동시에 진행할 최대 요청 수
+        requests_per_minute: 분당 최대 요청 수
+        on_progress: (완료 수, 전체 수)로 호출되는 진행 상황 콜백
+
+    Returns:
+        total, succeeded, failed, errors 요약 딕셔너리
+    """
+    answers = repository.get_answers_for_advice(question_id, only_missing)
+    summary = {"total": len(answers), "succeeded": 0, "failed": 0, "errors": []}
+
+    def on_result(result: Dict) -> None:
+        if result["error"] is None and repository.save_answer_advice(result["answer_id"], result["advice"]):
+            summary["succeeded"] += 1
+        else:
+            summary["failed"] += 1
+            summary["errors"].append({"answer_id": result["answer_id"], "error": result["error"]})
+        if on_progress is not None:
+            on_progress(summary["succeeded"] + summary["failed"], summary["total"])
+
+    if answers:
+        asyncio.run(generate_advice_batch(
+            ai_service,
+            answers,
+            concurrency=concurrency,
+            requests_per_minute=requests_per_minute,
+            on_result=on_result,
+        ))
+
+    return summary
+
+
+def main():
+    from advice_cache import AdviceCache
+    from ai_service import AzureOpenAIService
+
+    parser = argparse.ArgumentParser(description="저장된 답변의 AI 조언 일괄 생성")
+    parser.add_argument("--db", default="questions.db", help="데이터베이스 파일 경로")
+    parser.add_argument("--question-id", type=int, help="특정 질문의 답변만 처리 (기본: 모든 질문)")
+    parser.add_argument("--all", action="store_true", help="이미 조언이 있는 답변도 다시 생성")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 요청 수")
+    parser.add_argument("--rpm", type=int, default=DEFAULT_REQUESTS_PER_MINUTE, help="분당 최대 요청 수")
+    args = parser.parse_args()
+
+    repository = QuestionRepository(args.db)
+    ai_service = AzureOpenAIService(cache=AdviceCache(args.db))
+
+    def print_progress(done: int, total: int) -> None:
+        print(f"\r진행률: {done} / {total}", end="", flush=True)
+
+    summary = run_advice_batch(
+        repository,
+        ai_service,
+        question_id=args.question_id,
+        only_missing=not args.all,
+        concurrency=args.concurrency,
+        requests_per_minute=args.rpm,
+        on_progress=print_progress,
+    )
+
+    print()
+    print(f"완료: 성공 {summary['succeeded']}개, 실패 {summary['failed']}개 (전체 {summary['total']}개)")
+    for error in summary["errors"]:
+        print(f"  - 답변 {error['answer_id']}: {error['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from migrations import migrate, rebuild_answer_analytics, rebuild_answer_signatures
+from repository import QuestionRepository
+
+# 미리 정의된 합성 데이터베이스 크기 (질문 수, 답변 수)
+PRESETS = {
+    "small": (1_000, 10_000),
+    "medium": (10_000, 1_000_000),
+    "large": (100_000, 1_000_000),
+}
+
+# 합성 답변에 사용할 단어
+_WORDS = (
+    "I remember a time when my family went to the beach and we really enjoyed it "
+    "uhm so basically the weather was very nice and I think it was the best trip "
+    "because we ate delicious food and watched the sunset together with my friends"
+).split()
+
+_QUESTION_TYPES = ["home", "music", "travel", "shopping", "cafe", "bar", "park", "movie"]
+
+
+def _synthetic_text(rng: random.Random, min_words: int, max_words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(min_words, max_words)))
+
+
+def generate_database(
+    path: str,
+    question_count: int,
+    answer_count: int,
+    seed: int = 42,
+    index_similarity: bool = True,
+) -> None:
+    """
+    질문/답변 합성 데이터로 벤치마크용 데이터베이스를 만듭니다.
+
+    모든 마이그레이션과 트리거가 적용된 상태에서 삽입하므로 통계/검색 인덱스도 함께 채워지고,
+    Repository가 저장 시 계산하는 답변 분석 결과와 중복 답변 색인은 삽입 후 한 번에 계산합니다.
+
+    중복 답변 색인(MinHash)은 답변마다 Python에서 해시를 계산하므로 생성 시간의 대부분을 차지합니다
+    (답변 1만 개에 약 20초). index_similarity=False이면 색인을 만들지 않으며,
+    측정 중 새로 저장하는 답변만 색인됩니다.
+    """
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    conn.execute("PRAGMA foreign_keys=ON")
+    migrate(conn)
+
+    conn.executemany(
+        "INSERT INTO questions (question, type) VALUES (?, ?)",
+        (
+            (f"Question {i}: {_synthetic_text(rng, 8, 20)}?", rng.choice(_QUESTION_TYPES))
+            for i in range(question_count)
+        ),
+    )
+
+    # 답변 작성 시각은 최근 1년 안에 분포
+    now = time.time()
+    conn.executemany(
+        "INSERT INTO answers (question_id, answer, difficulty, created_at) "
+        "VALUES (?, ?, ?, datetime(?, 'unixepoch'))",
+        (
+            (
+                rng.randint(1, question_count),
+                _synthetic_text(rng, 30, 120),
+                rng.randint(1, 5),
+                now - rng.random() * 365 * 24 * 3600,
+            )
+            for _ in range(answer_count)
+        ),
+    )
+    rebuild_answer_analytics(conn)
+    if index_similarity:
+        rebuild_answer_signatures(conn)
+    conn.commit()
+    conn.close()
+
+
+def copy_database(source: str, destination: str) -> None:
+    """
+    데이터베이스를 벤치마크용 사본으로 복사합니다.
+
+    원본은 읽기 전용으로 열고 backup API로 복사하므로 WAL에만 있는 변경도 포함되며 원본은 바뀌지 않습니다.
+    """
+    source_conn = sqlite3.connect(f"{Path(source).resolve().as_uri()}?mode=ro", uri=True)
+    destination_conn = sqlite3.connect(destination)
+    try:
+        source_conn.backup(destination_conn)
+    finally:
+        destination_conn.close()
+        source_conn.close()
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _count_statements(statements: List[str]) -> int:
+    """
+    추적된 SQL 문 중 직접 실행한 문장 수를 셉니다.
+
+    트리거 본문은 최상위 문장과 같은 텍스트로 반복 보고되고, FTS5 내부 문장은 "--"로 시작하므로
+    연속으로 반복된 문장은 한 번만 세고 "--" 문장은 제외합니다.
+    """
+    count = 0
+    previous = None
+    for sql in statements:
+        if sql.startswith("--") or sql == previous:
+            continue
+        count += 1
+        previous = sql
+    return count
+
+
+def measure(repository: QuestionRepository, operation: Callable[[], object], iterations: int) -> Dict:
+    """
+    작업을 반복 실행해 지연 시간(밀리초) 분포와 작업당 SQL 문 수를 측정합니다.
+
+    읽기 캐시의 효과를 빼고 데이터베이스 경로만 측정하도록 매 반복 전에 캐시를 비웁니다.
+    """
+    statements = []
+    repository.pool.set_trace_callback(lambda sql: statements.append(sql))
+
+    latencies = []
+    query_counts = []
+    try:
+        for _ in range(iterations):
+            repository.read_cache.invalidate()
+            statements.clear()
+            start = time.perf_counter()
+            operation()
+            latencies.append((time.perf_counter() - start) * 1000)
+            query_counts.append(_count_statements(statements))
+    finally:
+        repository.pool.set_trace_callback(None)
+
+    return {
+        "iterations": iterations,
+        "p50_ms": round(_percentile(latencies, 50), 3),
+        "p95_ms": round(_percentile(latencies, 95), 3),
+        "mean_ms": round(statistics.mean(latencies), 3),
+        "queries_per_op": round(statistics.mean(query_counts), 2),
+    }
+
+
+def run_benchmarks(db_path: str, iterations: int, seed: int = 42) -> Dict:
+    """
+    주요 화면/작업의 핵심 경로를 측정합니다.
+
+    답변 저장과 질문 삭제를 실제로 실행하므로 db_path에는 벤치마크용 사본을 넘겨야 합니다.
+    """
+    rng = random.Random(seed)
+    repository = QuestionRepository(db_path)
+    # 삭제 등으로 ID가 1..N으로 이어지지 않을 수 있으므로 실제 ID 목록에서 뽑음
+    with repository.pool.connection() as conn:
+        question_ids = [row["id"] for row in conn.execute("SELECT id FROM questions ORDER BY id")]
+    question_count = len(question_ids)
+
+    def random_question_id() -> int:
+        return rng.choice(question_ids)
+
+    def list_stats():
+        repository.count_questions()
+        repository.get_question_stats_page(sort_key="answers", descending=True, limit=50)
+
+    def practice_queue():
+        repository.get_due_questions(20)
+
+    def detail_view():
+        question_id = random_question_id()
+        repository.get_question_stats_by_id(question_id)
+        summaries, _ = repository.get_answer_summaries_page(question_id, limit=20)
+        if summaries:
+            repository.get_answer(summaries[0]["id"])
+
+    def save_answer():
+        repository.save_answer(random_question_id(), _synthetic_text(rng, 30, 120), rng.randint(1, 5))
+
+    # 삭제는 같은 질문을 두 번 지우지 않도록 미리 뽑은 ID를 차례로 사용
+    delete_ids = iter(rng.sample(question_ids, min(iterations, question_count)))
+
+    def delete_with_cascade():
+        repository.delete_question(next(delete_ids))
+
+    operations = {
+        "list_stats": list_stats,
+        "practice_queue": practice_queue,
+        "detail_view": detail_view,
+        "save_answer": save_answer,
+        "delete_question_cascade": delete_with_cascade,
+    }
+    return {
+        name: measure(repository, operation, min(iterations, question_count))
+        for name, operation in operations.items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 데이터베이스로 Repository 핵심 경로 벤치마크")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small", help="합성 데이터 크기")
+    parser.add_argument("--questions", type=int, help="질문 수 (preset 대신 직접 지정)")
+    parser.add_argument("--answers", type=int, help="답변 수 (preset 대신 직접 지정)")
+    parser.add_argument("--iterations", type=int, default=50, help="작업별 반복 횟수")
+    parser.add_argument(
+        "--db",
+        help="합성 데이터베이스 경로 (없으면 그 경로에 생성). 측정은 임시 디렉터리의 사본에서 실행되어 원본은 바뀌지 않음",
+    )
+    parser.add_argument("--output", help="결과 JSON을 저장할 파일 경로 (기본: 표준 출력)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument(
+        "--skip-similarity",
+        action="store_true",
+        help="합성 데이터베이스 생성 시 중복 답변 색인(MinHash/LSH)을 만들지 않음 (대용량 생성 시간 단축)",
+    )
+    args = parser.parse_args()
+
+    question_count, answer_count = PRESETS[args.preset]
+    question_count = args.questions or question_count
+    answer_count = args.answers or answer_count
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source_path = args.db or os.path.join(temp_dir, "source.db")
+        if not os.path.exists(source_path):
+            print(f"합성 데이터베이스 생성 중: 질문 {question_count}개, 답변 {answer_count}개", file=sys.stderr)
+            start = time.perf_counter()
+            generate_database(
+                source_path,
+                question_count,
+                answer_count,
+                seed=args.seed,
+                index_similarity=not args.skip_similarity,
+            )
+            print(f"생성 완료 ({time.perf_counter() - start:.1f}초)", file=sys.stderr)
+
+        # 쓰기 작업(답변 저장, 질문 삭제)이 원본을 바꾸지 않도록 항상 사본에서 측정
+        db_path = os.path.join(temp_dir, "benchmark.db")
+        copy_database(source_path, db_path)
+
+        repository = QuestionRepository(db_path)
+        report = {
+            "database": {
+                "questions": repository.count_questions(),
+                "answers": sum(repository.get_answer_counts().values()),
+            },
+            "operations": run_benchmarks(db_path, args.iterations, seed=args.seed),
+        }
+        repository.pool.close_all()
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from queue import Empty, Full, LifoQueue
+from typing import Callable, Dict, Iterator, Optional
+
+from instrumentation import InstrumentedConnection
+
+# 풀에서 유지할 최대 유휴 연결 수
+DEFAULT_POOL_SIZE = 8
+
+# 잠금 대기 시간 (밀리초)
+BUSY_TIMEOUT_MS = 5000
+
+# 연결별 prepared statement 캐시 크기
+CACHED_STATEMENTS = 256
+
+# 페이지 캐시 크기 (음수: KiB 단위, 약 16MB)
+CACHE_SIZE_KIB = -16000
+
+
+class ConnectionPool:
+    """SQLite 연결을 재사용하는 연결 풀 클래스"""
+
+    def __init__(self, db_path: str, pool_size: int = DEFAULT_POOL_SIZE):
+        """
+        연결 풀 초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+            pool_size: 유지할 최대 유휴 연결 수
+        """
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self._idle: LifoQueue = LifoQueue(maxsize=pool_size)
+        self._trace_callback: Optional[Callable[[str], None]] = None
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """
+        WAL 모드, 외래 키 및 성능 관련 PRAGMA가 적용된 새 연결을 만듭니다.
+
+        쿼리 실행 시간은 InstrumentedConnection이 instrumentation.metrics에 기록합니다.
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS,
+            factory=InstrumentedConnection,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size={CACHE_SIZE_KIB}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def set_trace_callback(self, callback: Optional[Callable[[str], None]]) -> None:
+        """
+        이후 풀에서 빌려 가는 연결에서 실행되는 SQL 문마다 호출될 콜백을 설정합니다.
+
+        Args:
+            callback: 실행된 SQL 문을 인자로 받는 함수 (None이면 해제)
+        """
+        self._trace_callback = callback
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        풀에서 연결을 빌려 트랜잭션 단위로 사용합니다.
+
+        블록이 정상 종료되면 커밋하고, 예외가 발생하면 롤백합니다.
+        사용이 끝난 연결은 닫지 않고 풀로 반환합니다.
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except Empty:
+            conn = self._create_connection()
+        conn.set_trace_callback(self._trace_callback)
+
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            try:
+                self._idle.put_nowait(conn)
+            except Full:
+                conn.close()
+
+    def close_all(self) -> None:
+        """풀에 있는 모든 유휴 연결을 닫습니다."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                break
+            conn.close()
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    """데이터베이스 경로별로 프로세스 전체에서 공유되는 연결 풀을 반환합니다."""
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = ConnectionPool(db_path)
+            _pools[db_path] = pool
+        return pool
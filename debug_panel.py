@@ -0,0 +1,64 @@
+import os
+from typing import Optional
+
+import streamlit as st
+
+from instrumentation import RunStats, metrics, start_metrics_server
+
+# 사이드바 디버그 패널 표시 여부
+DEBUG_PANEL_ENABLED = os.getenv("METRICS_DEBUG_PANEL", "0") == "1"
+
+# 디버그 패널에 표시할 느린 쿼리 수
+SLOWEST_QUERY_COUNT = 10
+
+
+@st.cache_resource
+def start_metrics_endpoint():
+    """METRICS_PORT가 설정되어 있으면 서버 프로세스당 한 번 Prometheus 지표 서버를 시작합니다."""
+    port = os.getenv("METRICS_PORT")
+    if not port:
+        return None
+    return start_metrics_server(int(port), os.getenv("METRICS_HOST", "127.0.0.1"))
+
+
+def begin_instrumented_run() -> RunStats:
+    """이번 스크립트 실행(rerun)의 쿼리/AI 호출 기록을 시작합니다."""
+    start_metrics_endpoint()
+    return metrics.begin_run()
+
+
+def render_debug_panel(run: Optional[RunStats]) -> None:
+    """이번 실행의 전체 시간, 쿼리 수/시간, AI 호출 시간을 사이드바에 표시합니다."""
+    if not DEBUG_PANEL_ENABLED or run is None:
+        return
+
+    elapsed_ms = run.elapsed_seconds * 1000
+    query_ms = run.query_seconds * 1000
+    ai_ms = run.ai_seconds * 1000
+
+    with st.sidebar.expander("🛠 디버그: 실행 시간", expanded=False):
+        col1, col2 = st.columns(2)
+        col1.metric("전체", f"{elapsed_ms:.0f} ms")
+        col2.metric("쿼리", f"{run.query_count}개")
+        col1.metric("SQLite", f"{query_ms:.1f} ms")
+        col2.metric("AI", f"{ai_ms:.0f} ms")
+        # 나머지는 Streamlit 렌더링과 파이썬 처리 시간
+        st.caption(f"렌더링/기타: {max(0.0, elapsed_ms - query_ms - ai_ms):.0f} ms")
+
+        if run.queries:
+            st.markdown("**느린 쿼리**")
+            slowest = sorted(run.queries, key=lambda query: query["ms"], reverse=True)[:SLOWEST_QUERY_COUNT]
+            st.dataframe(
+                [{"ms": query["ms"], "sql": query["sql"]} for query in slowest],
+                hide_index=True,
+            )
+            for query in slowest:
+                if query["plan"]:
+                    st.code(f"{query['sql']}\n\n" + "\n".join(query["plan"]), language="sql")
+
+        if run.ai_calls:
+            st.markdown("**AI 호출**")
+            st.dataframe(run.ai_calls, hide_index=True)
+
+        if os.getenv("METRICS_PORT"):
+            st.caption(f"Prometheus 지표: http://{os.getenv('METRICS_HOST', '127.0.0.1')}:{os.getenv('METRICS_PORT')}/metrics")
@@ -0,0 +1,93 @@
+import atexit
+import threading
+from typing import Dict, Optional, Tuple
+
+from repository import QuestionRepository
+
+# 모아 둔 초안을 저장하는 주기 (초)
+DEFAULT_FLUSH_INTERVAL_SECONDS = 3.0
+
+
+class DraftWriter:
+    """
+    답변 초안을 백그라운드 스레드에서 모아 저장하는 클래스
+
+    submit()은 메모리의 대기열에 넣기만 하고 바로 반환하므로 입력 처리에 쓰기 지연이 생기지 않습니다.
+    같은 (세션, 질문)에 대한 변경은 대기열에서 마지막 값 하나로 합쳐지고,
+    flush_interval_seconds마다 한 번의 트랜잭션으로 저장됩니다.
+    """
+
+    def __init__(self, repository: QuestionRepository, flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS):
+        """
+        초안 저장기 초기화
+
+        Args:
+            repository: 초안을 저장할 Repository
+            flush_interval_seconds: 모아 둔 초안을 저장하는 주기 (초)
+        """
+        self.repository = repository
+        self.flush_interval_seconds = flush_interval_seconds
+        self.last_error: Optional[Exception] = None
+
+        # (세션 ID, 질문 ID) -> (답변 내용, 난이도), None이면 초안 삭제
+        self._pending: Dict[Tuple[str, int], Optional[Tuple[str, int]]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+
+        self._thread = threading.Thread(target=self._run, name="draft-writer", daemon=True)
+        self._thread.start()
+        # 프로세스 종료 시 남은 초안 저장
+        atexit.register(self.close)
+
+    def submit(self, session_id: str, question_id: int, answer: str, difficulty: int) -> None:
+        """답변 초안을 대기열에 넣습니다. 같은 (세션, 질문)의 이전 값은 덮어씁니다."""
+        with self._lock:
+            self._pending[(session_id, question_id)] = (answer, difficulty)
+
+    def discard(self, session_id: str, question_id: int) -> None:
+        """답변을 저장한 뒤 더 이상 필요 없는 초안을 삭제하도록 대기열에 넣습니다."""
+        with self._lock:
+            self._pending[(session_id, question_id)] = None
+
+    def flush(self) -> int:
+        """
+        대기열의 초안을 지금 저장합니다.
+
+        Returns:
+            저장/삭제한 초안 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+
+            upserts = [
+                (session_id, question_id, value[0], value[1])
+                for (session_id, question_id), value in pending.items()
+                if value is not None
+            ]
+            deletes = [key for key, value in pending.items() if value is None]
+            try:
+                self.repository.save_drafts(upserts, deletes)
+                self.last_error = None
+            except Exception as e:
+                # 저장에 실패한 초안은 그사이 새 값이 들어오지 않았다면 다음 주기에 다시 시도
+                self.last_error = e
+                with self._lock:
+                    for key, value in pending.items():
+                        self._pending.setdefault(key, value)
+                return 0
+
+            return len(pending)
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.flush_interval_seconds):
+            self.flush()
+
+    def close(self) -> None:
+        """백그라운드 스레드를 멈추고 남은 초안을 저장합니다."""
+        self._stopped.set()
+        self._thread.join(timeout=self.flush_interval_seconds)
+        self.flush()
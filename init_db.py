@@ -1,35 +1,35 @@
 import sqlite3
 import os
+import argparse
+from migrations import (
+    bump_cache_version,
+    count_orphan_answers,
+    delete_orphan_answers,
+    migrate,
+    rebuild_answer_analytics,
+    rebuild_answer_signatures,
+    rebuild_question_stats,
+)
 
 # 데이터베이스 파일 경로
 DB_PATH = "questions.db"
 
 # 데이터베이스 초기화
 def init_database():
-    """SQLite 데이터베이스를 생성하고 초기 질문 데이터를 삽입합니다."""
+    """SQLite 데이터베이스를 최신 스키마로 마이그레이션하고 초기 질문 데이터를 삽입합니다."""
     conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
+    conn.execute("PRAGMA foreign_keys=ON")
+    
+    # 테이블 생성 및 스키마 마이그레이션 (PRAGMA user_version 기준)
+    schema_version = migrate(conn)
+    print(f"스키마 버전: {schema_version}")
     
-    # 질문 테이블 생성
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS questions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            question TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # 답변 테이블 생성 (1:N 관계, 난이도 포함)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS answers (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            question_id INTEGER NOT NULL,
-            answer TEXT NOT NULL,
-            difficulty INTEGER NOT NULL CHECK(difficulty >= 1 AND difficulty <= 5),
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (question_id) REFERENCES questions (id) ON DELETE CASCADE
-        )
-    ''')
+    # 질문이 없는 답변은 자동으로 지우지 않고 알리기만 함
+    orphan_count = count_orphan_answers(conn)
+    if orphan_count:
+        print(f"질문이 없는 답변이 {orphan_count}개 있습니다. 삭제하려면 --delete-orphan-answers 옵션으로 실행하세요.")
+    
+    cursor = conn.cursor()
     
     # 샘플 질문 데이터
     sample_questions = [
@@ -56,5 +56,93 @@ def init_database():
     conn.close()
     print(f"데이터베이스 초기화 완료: {DB_PATH}")
 
+# 질문별 통계 테이블 재계산
+def rebuild_stats():
+    """answers 테이블 전체로부터 question_stats 테이블을 다시 계산합니다."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA foreign_keys=ON")
+    migrate(conn)
+    
+    rebuild_question_stats(conn)
+    bump_cache_version(conn)
+    conn.commit()
+    
+    count = conn.execute("SELECT COUNT(*) FROM question_stats").fetchone()[0]
+    conn.close()
+    print(f"질문별 통계 재계산 완료: {count}개 질문")
+
+# 답변 분석 결과 재계산
+def rebuild_analytics():
+    """모든 답변을 다시 토큰화해 답변 분석 결과와 질문별/기간별 집계 테이블을 다시 계산합니다."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA foreign_keys=ON")
+    migrate(conn)
+    
+    rebuild_answer_analytics(conn)
+    bump_cache_version(conn)
+    conn.commit()
+    
+    count = conn.execute("SELECT COUNT(*) FROM answer_features").fetchone()[0]
+    conn.close()
+    print(f"답변 분석 재계산 완료: {count}개 답변")
+
+# 질문이 없는 답변 삭제
+def delete_orphans():
+    """외래 키가 꺼져 있던 동안 CASCADE 없이 남은, 질문이 없는 답변을 삭제합니다."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA foreign_keys=ON")
+    migrate(conn)
+    
+    deleted = delete_orphan_answers(conn)
+    conn.commit()
+    conn.close()
+    print(f"질문이 없는 답변 {deleted}개를 삭제했습니다.")
+
+# 중복 답변 검색 인덱스 재계산
+def rebuild_similarity():
+    """모든 답변의 MinHash 서명과 LSH 버킷을 다시 계산합니다."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA foreign_keys=ON")
+    migrate(conn)
+    
+    rebuild_answer_signatures(conn)
+    conn.commit()
+    
+    count = conn.execute("SELECT COUNT(*) FROM answer_minhash").fetchone()[0]
+    conn.close()
+    print(f"중복 답변 검색 인덱스 재계산 완료: {count}개 답변")
+
 if __name__ == "__main__":
-    init_database()
+    parser = argparse.ArgumentParser(description="질문 데이터베이스 초기화")
+    parser.add_argument(
+        "--rebuild-stats",
+        action="store_true",
+        help="answers 테이블로부터 질문별 통계(question_stats)를 다시 계산합니다",
+    )
+    parser.add_argument(
+        "--rebuild-analytics",
+        action="store_true",
+        help="모든 답변을 다시 분석해 답변 분석 결과와 집계 테이블을 다시 계산합니다",
+    )
+    parser.add_argument(
+        "--rebuild-similarity",
+        action="store_true",
+        help="모든 답변의 중복 검색용 MinHash 서명과 LSH 버킷을 다시 계산합니다",
+    )
+    parser.add_argument(
+        "--delete-orphan-answers",
+        action="store_true",
+        help="질문이 삭제되었는데 남아 있는 답변을 삭제합니다",
+    )
+    args = parser.parse_args()
+    
+    if args.rebuild_stats:
+        rebuild_stats()
+    elif args.rebuild_analytics:
+        rebuild_analytics()
+    elif args.rebuild_similarity:
+        rebuild_similarity()
+    elif args.delete_orphan_answers:
+        delete_orphans()
+    else:
+        init_database()
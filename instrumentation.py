@@ -0,0 +1,344 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# 쿼리 지연 시간 히스토그램 구간 (초)
+QUERY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+# AI 호출 지연 시간 히스토그램 구간 (초)
+AI_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0)
+
+# 한 번의 실행(rerun)에서 기록해 둘 최대 쿼리 수
+MAX_RUN_QUERIES = 500
+
+# 기록/로그에 남길 SQL 문 최대 길이
+SQL_PREVIEW_LENGTH = 300
+
+# EXPLAIN QUERY PLAN을 남길 읽기 쿼리의 첫 키워드
+EXPLAIN_STATEMENT_PREFIXES = ("SELECT", "WITH")
+
+
+def _is_read_query(sql: str) -> bool:
+    """앞쪽 공백과 "--" 주석을 건너뛴 첫 키워드가 SELECT/WITH인지 확인합니다 (길이가 다른 키워드도 비교)."""
+    statement = sql.lstrip()
+    while statement.startswith("--"):
+        _, _, statement = statement.partition("\n")
+        statement = statement.lstrip()
+    return statement.upper().startswith(EXPLAIN_STATEMENT_PREFIXES)
+
+
+class Histogram:
+    """Prometheus 히스토그램 형식(누적 구간, 합계, 개수)으로 관측값을 모으는 클래스"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, upper in enumerate(self.buckets):
+            if value <= upper:
+                self.counts[i] += 1
+        self.total += value
+        self.count += 1
+
+    def render(self, name: str, labels: str = "") -> List[str]:
+        prefix = f"{labels}," if labels else ""
+        lines = [
+            f'{name}_bucket{{{prefix}le="{upper}"}} {count}'
+            for upper, count in zip(self.buckets, self.counts)
+        ]
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.total:.6f}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+@dataclass
+class RunStats:
+    """Streamlit 스크립트 한 번 실행(rerun) 동안의 쿼리/AI 호출 기록"""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    query_count: int = 0
+    query_seconds: float = 0.0
+    queries: List[Dict] = field(default_factory=list)
+    ai_calls: List[Dict] = field(default_factory=list)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def ai_seconds(self) -> float:
+        return sum(call["seconds"] for call in self.ai_calls)
+
+
+class AICall:
+    """track_ai_call 블록 안에서 첫 토큰 시각과 토큰 사용량을 기록하는 객체"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.first_token_seconds: Optional[float] = None
+        self.input_tokens: Optional[int] = None
+        self.cached_input_tokens: Optional[int] = None
+        self.output_tokens: Optional[int] = None
+
+    def mark_first_token(self) -> None:
+        if self.first_token_seconds is None:
+            self.first_token_seconds = time.perf_counter() - self.started_at
+
+    def set_usage(self, usage_metadata: Optional[Dict]) -> None:
+        """
+        LangChain 메시지의 usage_metadata(input_tokens/output_tokens)를 기록합니다.
+
+        입력 토큰 중 제공자 측 프롬프트 캐시에서 읽은 토큰 수(input_token_details.cache_read)도 함께 기록합니다.
+        """
+        if usage_metadata:
+            self.input_tokens = usage_metadata.get("input_tokens")
+            self.output_tokens = usage_metadata.get("output_tokens")
+            self.cached_input_tokens = (usage_metadata.get("input_token_details") or {}).get("cache_read")
+
+
+class Metrics:
+    """
+    데이터베이스 쿼리와 AI 호출의 지연 시간/횟수/토큰 사용량을 모으는 프로세스 전역 수집기
+
+    전체 누적값은 Prometheus 텍스트 형식으로, 실행(rerun)별 기록은 RunStats로 제공합니다.
+    실행별 기록은 begin_run()을 호출한 스레드(Streamlit 스크립트 실행 스레드)에서 일어난 작업만 모읍니다.
+    """
+
+    def __init__(
+        self,
+        slow_query_ms: float = 100.0,
+        explain_slow_queries: bool = False,
+        log_file: Optional[str] = None,
+    ):
+        """
+        수집기 초기화
+
+        Args:
+            slow_query_ms: 느린 쿼리로 볼 기준 시간 (밀리초)
+            explain_slow_queries: 느린 SELECT 쿼리의 EXPLAIN QUERY PLAN을 함께 기록할지 여부
+            log_file: 느린 쿼리와 AI 호출을 JSON 줄 단위로 기록할 파일 경로 (없으면 기록 안 함)
+        """
+        self.slow_query_ms = slow_query_ms
+        self.explain_slow_queries = explain_slow_queries
+        self.log_file = log_file
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._query_histograms: Dict[str, Histogram] = {}
+        self._slow_queries = 0
+        self._ai_histograms: Dict[str, Histogram] = {}
+        self._ai_requests: Dict[Tuple[str, str], int] = {}
+        self._ai_tokens = {"input": 0, "cached_input": 0, "output": 0}
+
+    @classmethod
+    def from_env(cls) -> "Metrics":
+        """METRICS_* 환경 변수로 수집기를 만듭니다."""
+        return cls(
+            slow_query_ms=float(os.getenv("METRICS_SLOW_QUERY_MS", "100")),
+            explain_slow_queries=os.getenv("METRICS_EXPLAIN_SLOW_QUERIES", "0") == "1",
+            log_file=os.getenv("METRICS_LOG_FILE") or None,
+        )
+
+    def begin_run(self) -> RunStats:
+        """현재 스레드에서 새 실행 기록을 시작하고 반환합니다."""
+        run = RunStats()
+        self._local.run = run
+        return run
+
+    def current_run(self) -> Optional[RunStats]:
+        return getattr(self._local, "run", None)
+
+    def record_query(self, sql: str, seconds: float, plan: Optional[List[str]] = None) -> None:
+        operation = sql.lstrip().split(None, 1)[0].lower() if sql.strip() else "other"
+        if operation not in ("select", "insert", "update", "delete", "with"):
+            operation = "other"
+        slow = seconds * 1000 >= self.slow_query_ms
+
+        with self._lock:
+            histogram = self._query_histograms.get(operation)
+            if histogram is None:
+                histogram = self._query_histograms[operation] = Histogram(QUERY_BUCKETS)
+            histogram.observe(seconds)
+            if slow:
+                self._slow_queries += 1
+
+        run = self.current_run()
+        if run is not None:
+            run.query_count += 1
+            run.query_seconds += seconds
+            if len(run.queries) < MAX_RUN_QUERIES:
+                run.queries.append({
+                    "sql": " ".join(sql.split())[:SQL_PREVIEW_LENGTH],
+                    "ms": round(seconds * 1000, 3),
+                    "plan": plan,
+                })
+
+        if slow:
+            self._log({"event": "slow_query", "sql": " ".join(sql.split())[:SQL_PREVIEW_LENGTH],
+                       "ms": round(seconds * 1000, 3), "plan": plan})
+
+    def should_explain(self, sql: str, seconds: float) -> bool:
+        return (
+            self.explain_slow_queries
+            and seconds * 1000 >= self.slow_query_ms
+            and _is_read_query(sql)
+        )
+
+    @contextmanager
+    def track_ai_call(self, operation: str) -> Iterator[AICall]:
+        """
+        블록 실행 시간을 AI 호출 하나로 기록합니다.
+
+        블록 안에서 AICall.mark_first_token() / set_usage()로 첫 토큰 시각과 토큰 사용량을 남길 수 있습니다.
+        스트림을 끝까지 읽지 않고 닫으면 상태는 cancelled로 기록됩니다.
+        """
+        call = AICall()
+        status = "ok"
+        try:
+            yield call
+        except GeneratorExit:
+            status = "cancelled"
+            raise
+        except BaseException:
+            status = "error"
+            raise
+        finally:
+            self._record_ai_call(operation, status, call)
+
+    def _record_ai_call(self, operation: str, status: str, call: AICall) -> None:
+        seconds = time.perf_counter() - call.started_at
+        with self._lock:
+            histogram = self._ai_histograms.get(operation)
+            if histogram is None:
+                histogram = self._ai_histograms[operation] = Histogram(AI_BUCKETS)
+            histogram.observe(seconds)
+            self._ai_requests[(operation, status)] = self._ai_requests.get((operation, status), 0) + 1
+            self._ai_tokens["input"] += call.input_tokens or 0
+            self._ai_tokens["cached_input"] += call.cached_input_tokens or 0
+            self._ai_tokens["output"] += call.output_tokens or 0
+
+        record = {
+            "operation": operation,
+            "status": status,
+            "seconds": round(seconds, 3),
+            "first_token_seconds": (
+                round(call.first_token_seconds, 3) if call.first_token_seconds is not None else None
+            ),
+            "input_tokens": call.input_tokens,
+            "cached_input_tokens": call.cached_input_tokens,
+            "output_tokens": call.output_tokens,
+        }
+        run = self.current_run()
+        if run is not None:
+            run.ai_calls.append(record)
+        self._log({"event": "ai_call", **record})
+
+    def _log(self, record: Dict) -> None:
+        if not self.log_file:
+            return
+        record = {"time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"), **record}
+        with self._lock:
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def render_prometheus(self) -> str:
+        """누적 지표를 Prometheus 텍스트 노출 형식으로 반환합니다."""
+        with self._lock:
+            lines = [
+                "# HELP opic_db_query_duration_seconds SQLite query execution time.",
+                "# TYPE opic_db_query_duration_seconds histogram",
+            ]
+            for operation, histogram in sorted(self._query_histograms.items()):
+                lines.extend(histogram.render("opic_db_query_duration_seconds", f'operation="{operation}"'))
+            lines += [
+                "# HELP opic_db_slow_queries_total Queries slower than the slow query threshold.",
+                "# TYPE opic_db_slow_queries_total counter",
+                f"opic_db_slow_queries_total {self._slow_queries}",
+                "# HELP opic_ai_request_duration_seconds LLM request time.",
+                "# TYPE opic_ai_request_duration_seconds histogram",
+            ]
+            for operation, histogram in sorted(self._ai_histograms.items()):
+                lines.extend(histogram.render("opic_ai_request_duration_seconds", f'operation="{operation}"'))
+            lines += [
+                "# HELP opic_ai_requests_total LLM requests by operation and status.",
+                "# TYPE opic_ai_requests_total counter",
+            ]
+            for (operation, status), count in sorted(self._ai_requests.items()):
+                lines.append(f'opic_ai_requests_total{{operation="{operation}",status="{status}"}} {count}')
+            lines += [
+                "# HELP opic_ai_tokens_total LLM tokens reported by the backend.",
+                "# TYPE opic_ai_tokens_total counter",
+            ]
+            for kind, count in self._ai_tokens.items():
+                lines.append(f'opic_ai_tokens_total{{type="{kind}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전체에서 공유하는 수집기
+metrics = Metrics.from_env()
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """
+    execute / executemany의 실행 시간을 metrics에 기록하는 SQLite 연결 클래스
+
+    SELECT는 첫 행을 얻을 때까지의 시간이 기록됩니다 (정렬/집계 비용은 이 단계에 포함됨).
+    """
+
+    def execute(self, sql, parameters=(), /):
+        start = time.perf_counter()
+        cursor = super().execute(sql, parameters)
+        self._record(sql, parameters, time.perf_counter() - start)
+        return cursor
+
+    def executemany(self, sql, parameters, /):
+        start = time.perf_counter()
+        cursor = super().executemany(sql, parameters)
+        self._record(sql, None, time.perf_counter() - start)
+        return cursor
+
+    def _record(self, sql, parameters, seconds: float) -> None:
+        plan = None
+        if parameters is not None and metrics.should_explain(sql, seconds):
+            try:
+                rows = super().execute(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+                plan = [row[3] for row in rows]
+            except sqlite3.Error:
+                plan = None
+        metrics.record_query(sql, seconds, plan)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = metrics.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 스크레이프 요청마다 stderr에 로그를 남기지 않음
+        pass
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """/metrics 경로로 Prometheus 텍스트 지표를 제공하는 HTTP 서버를 백그라운드 스레드에서 시작합니다."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
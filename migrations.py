@@ -0,0 +1,700 @@
+import sqlite3
+from itertools import islice
+from typing import Callable, Iterable, List, Tuple
+
+from analytics import extract_features
+from similarity import band_buckets, minhash_signature, pack_signature
+
+# 답변 분석 결과/유사도 색인을 다시 계산할 때 한 번에 처리할 답변 수
+ANALYTICS_BATCH_SIZE = 1000
+
+
+def _create_base_tables(conn: sqlite3.Connection) -> None:
+    """질문/답변 기본 테이블을 만들고 수동으로 추가되던 type 컬럼을 보장합니다."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS questions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            question TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            type TEXT(20)
+        )
+    ''')
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS answers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            question_id INTEGER NOT NULL,
+            answer TEXT NOT NULL,
+            difficulty INTEGER NOT NULL CHECK(difficulty >= 1 AND difficulty <= 5),
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (question_id) REFERENCES questions (id) ON DELETE CASCADE
+        )
+    ''')
+
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(questions)")]
+    if "type" not in columns:
+        conn.execute("ALTER TABLE questions ADD COLUMN type TEXT(20)")
+
+
+def _add_lookup_indexes(conn: sqlite3.Connection) -> None:
+    """질문별 답변 조회/집계와 유형별 조회를 위한 인덱스를 추가합니다."""
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_answers_question_created
+        ON answers (question_id, created_at)
+    ''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_questions_type ON questions (type)")
+
+
+def count_orphan_answers(conn: sqlite3.Connection) -> int:
+    """외래 키가 꺼져 있던 동안 CASCADE 없이 남은, 질문이 없는 답변 수를 반환합니다."""
+    return conn.execute('''
+        SELECT COUNT(*) FROM answers
+        WHERE question_id NOT IN (SELECT id FROM questions)
+    ''').fetchone()[0]
+
+
+def delete_orphan_answers(conn: sqlite3.Connection) -> int:
+    """
+    질문이 없는 답변을 삭제합니다.
+
+    사용자 데이터를 지우므로 마이그레이션에서는 실행하지 않고 명시적으로 요청했을 때만 실행합니다.
+
+    Returns:
+        삭제된 답변 수
+    """
+    cursor = conn.execute('''
+        DELETE FROM answers
+        WHERE question_id NOT IN (SELECT id FROM questions)
+    ''')
+    return cursor.rowcount
+
+
+def rebuild_question_stats(conn: sqlite3.Connection) -> None:
+    """answers 테이블 전체로부터 question_stats 테이블을 다시 계산합니다."""
+    conn.execute("DELETE FROM question_stats")
+    conn.execute('''
+        INSERT INTO question_stats (
+            question_id, answer_count, difficulty_sum, last_answer_at, last_difficulty
+        )
+        SELECT q.id,
+               COUNT(a.id),
+               COALESCE(SUM(a.difficulty), 0),
+               (SELECT created_at FROM answers
+                WHERE question_id = q.id
+                ORDER BY created_at DESC, id DESC LIMIT 1),
+               (SELECT difficulty FROM answers
+                WHERE question_id = q.id
+                ORDER BY created_at DESC, id DESC LIMIT 1)
+        FROM questions q
+        LEFT JOIN answers a ON a.question_id = q.id
+        GROUP BY q.id
+    ''')
+
+
+def _add_question_stats(conn: sqlite3.Connection) -> None:
+    """answers 변경 시 트리거로 갱신되는 질문별 통계 테이블을 추가합니다."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS question_stats (
+            question_id INTEGER PRIMARY KEY,
+            answer_count INTEGER NOT NULL DEFAULT 0,
+            difficulty_sum INTEGER NOT NULL DEFAULT 0,
+            last_answer_at TIMESTAMP,
+            last_difficulty INTEGER,
+            FOREIGN KEY (question_id) REFERENCES questions (id) ON DELETE CASCADE
+        )
+    ''')
+
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_answers_stats_insert
+        AFTER INSERT ON answers
+        BEGIN
+            INSERT INTO question_stats (
+                question_id, answer_count, difficulty_sum, last_answer_at, last_difficulty
+            )
+            VALUES (NEW.question_id, 1, NEW.difficulty, NEW.created_at, NEW.difficulty)
+            ON CONFLICT (question_id) DO UPDATE SET
+                answer_count = answer_count + 1,
+                difficulty_sum = difficulty_sum + NEW.difficulty,
+                last_answer_at = CASE
+                    WHEN last_answer_at IS NULL OR NEW.created_at >= last_answer_at
+                    THEN NEW.created_at ELSE last_answer_at END,
+                last_difficulty = CASE
+                    WHEN last_answer_at IS NULL OR NEW.created_at >= last_answer_at
+                    THEN NEW.difficulty ELSE last_difficulty END;
+        END
+    ''')
+
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_answers_stats_delete
+        AFTER DELETE ON answers
+        BEGIN
+            UPDATE question_stats SET
+                answer_count = answer_count - 1,
+                difficulty_sum = difficulty_sum - OLD.difficulty,
+                last_answer_at = (
+                    SELECT created_at FROM answers
+                    WHERE question_id = OLD.question_id
+                    ORDER BY created_at DESC, id DESC LIMIT 1
+                ),
+                last_difficulty = (
+                    SELECT difficulty FROM answers
+                    WHERE question_id = OLD.question_id
+                    ORDER BY created_at DESC, id DESC LIMIT 1
+                )
+            WHERE question_id = OLD.question_id;
+        END
+    ''')
+
+    # 질문 이동(question_id 변경)도 처리하도록 이전 질문에서 빼고 새 질문에 더함
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_answers_stats_update
+        AFTER UPDATE OF question_id, difficulty, created_at ON answers
+        BEGIN
+            UPDATE question_stats SET
+                answer_count = answer_count - 1,
+                difficulty_sum = difficulty_sum - OLD.difficulty
+            WHERE question_id = OLD.question_id;
+
+            INSERT INTO question_stats (question_id, answer_count, difficulty_sum)
+            VALUES (NEW.question_id, 1, NEW.difficulty)
+            ON CONFLICT (question_id) DO UPDATE SET
+                answer_count = answer_count + 1,
+                difficulty_sum = difficulty_sum + NEW.difficulty;
+
+            UPDATE question_stats SET
+                last_answer_at = (
+                    SELECT created_at FROM answers
+                    WHERE question_id = question_stats.question_id
+                    ORDER BY created_at DESC, id DESC LIMIT 1
+                ),
+                last_difficulty = (
+                    SELECT difficulty FROM answers
+                    WHERE question_id = question_stats.question_id
+                    ORDER BY created_at DESC, id DESC LIMIT 1
+                )
+            WHERE question_id IN (OLD.question_id, NEW.question_id);
+        END
+    ''')
+
+    rebuild_question_stats(conn)
+
+
+def _add_advice_cache(conn: sqlite3.Connection) -> None:
+    """AI 조언 응답 캐시 테이블을 추가합니다."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS advice_cache (
+            key TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            last_accessed_at REAL NOT NULL,
+            hit_count INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_advice_cache_last_accessed
+        ON advice_cache (last_accessed_at)
+    ''')
+
+
+def _add_answer_advice(conn: sqlite3.Connection) -> None:
+    """답변별 AI 조언 저장 컬럼을 추가합니다."""
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(answers)")]
+    if "advice" not in columns:
+        conn.execute("ALTER TABLE answers ADD COLUMN advice TEXT")
+    if "advice_at" not in columns:
+        conn.execute("ALTER TABLE answers ADD COLUMN advice_at TIMESTAMP")
+
+
+def _add_full_text_search(conn: sqlite3.Connection) -> None:
+    """질문/답변 본문에 대한 FTS5 전문 검색 인덱스와 동기화 트리거를 추가합니다."""
+    # 원본 테이블을 content로 참조하는 external content 테이블 (본문을 중복 저장하지 않음)
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5(
+            question,
+            content='questions',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    ''')
+    conn.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS answers_fts USING fts5(
+            answer,
+            content='answers',
+            content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    ''')
+
+    for table, column in (("questions", "question"), ("answers", "answer")):
+        fts = f"{table}_fts"
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_{fts}_insert
+            AFTER INSERT ON {table}
+            BEGIN
+                INSERT INTO {fts} (rowid, {column}) VALUES (NEW.id, NEW.{column});
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_{fts}_delete
+            AFTER DELETE ON {table}
+            BEGIN
+                INSERT INTO {fts} ({fts}, rowid, {column}) VALUES ('delete', OLD.id, OLD.{column});
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_{fts}_update
+            AFTER UPDATE OF {column} ON {table}
+            BEGIN
+                INSERT INTO {fts} ({fts}, rowid, {column}) VALUES ('delete', OLD.id, OLD.{column});
+                INSERT INTO {fts} (rowid, {column}) VALUES (NEW.id, NEW.{column});
+            END
+        ''')
+
+        # 기존 데이터 색인
+        conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+
+def _add_question_schedule(conn: sqlite3.Connection) -> None:
+    """간격 반복(SM-2) 복습 일정 테이블을 추가합니다."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS question_schedule (
+            question_id INTEGER PRIMARY KEY,
+            due_at TIMESTAMP NOT NULL,
+            ease REAL NOT NULL DEFAULT 2.5,
+            interval_days REAL NOT NULL DEFAULT 0,
+            repetitions INTEGER NOT NULL DEFAULT 0,
+            last_reviewed_at TIMESTAMP,
+            FOREIGN KEY (question_id) REFERENCES questions (id) ON DELETE CASCADE
+        )
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_question_schedule_due
+        ON question_schedule (due_at)
+    ''')
+
+    # 새 질문은 추가 즉시 복습 대상
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_questions_schedule_insert
+        AFTER INSERT ON questions
+        BEGIN
+            INSERT OR IGNORE INTO question_schedule (question_id, due_at)
+            VALUES (NEW.id, CURRENT_TIMESTAMP);
+        END
+    ''')
+
+    # 기존 질문: 답변한 적 없는 질문이 먼저, 그다음 마지막 답변이 오래된 순서로 복습
+    conn.execute('''
+        INSERT OR IGNORE INTO question_schedule (question_id, due_at, last_reviewed_at)
+        SELECT q.id, COALESCE(s.last_answer_at, '1970-01-01 00:00:00'), s.last_answer_at
+        FROM questions q
+        LEFT JOIN question_stats s ON s.question_id = q.id
+    ''')
+
+
+def _add_question_text_index(conn: sqlite3.Connection) -> None:
+    """
+    질문 내용 인덱스를 추가합니다.
+
+    가져오기의 중복 확인이 공백/대소문자를 무시하도록 Python에서 비교하게 되면서
+    이 인덱스를 쓰는 쿼리가 없어져, 이후 _drop_question_text_index에서 삭제합니다.
+    """
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_questions_question ON questions (question)")
+
+
+def _add_practice_sessions(conn: sqlite3.Connection) -> None:
+    """연습 세션별 질문 순서(질문 ID 목록)와 진행 위치를 저장하는 테이블을 추가합니다."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS practice_sessions (
+            id TEXT PRIMARY KEY,
+            question_ids TEXT NOT NULL,
+            cursor INTEGER NOT NULL DEFAULT 0,
+            shuffle INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_practice_sessions_updated
+        ON practice_sessions (updated_at)
+    ''')
+
+
+def _add_drafts(conn: sqlite3.Connection) -> None:
+    """연습 세션에서 작성 중인(아직 저장하지 않은) 답변 초안 테이블을 추가합니다."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS drafts (
+            session_id TEXT NOT NULL,
+            question_id INTEGER NOT NULL,
+            answer TEXT NOT NULL,
+            difficulty INTEGER NOT NULL CHECK(difficulty >= 1 AND difficulty <= 5),
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (session_id, question_id),
+            FOREIGN KEY (session_id) REFERENCES practice_sessions (id) ON DELETE CASCADE,
+            FOREIGN KEY (question_id) REFERENCES questions (id) ON DELETE CASCADE
+        )
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_drafts_question
+        ON drafts (question_id)
+    ''')
+
+
+def save_answer_features(conn: sqlite3.Connection, answers: Iterable[Tuple[int, str]]) -> None:
+    """
+    답변을 토큰화해 answer_features에 저장합니다.
+
+    질문별/기간별 집계 테이블은 answer_features 트리거가 증분으로 갱신합니다.
+    created_at은 UTC(CURRENT_TIMESTAMP)이므로 기간(일)은 서버의 현지 시간 기준 날짜로 저장합니다.
+
+    Args:
+        conn: 데이터베이스 연결
+        answers: (답변 ID, 답변 내용) 튜플 목록
+    """
+    rows = []
+    for answer_id, text in answers:
+        features = extract_features(text)
+        rows.append((
+            answer_id,
+            features.word_count,
+            features.unique_word_count,
+            features.sentence_count,
+            features.filler_count,
+        ))
+
+    conn.executemany('''
+        INSERT INTO answer_features (
+            answer_id, question_id, period,
+            word_count, unique_word_count, sentence_count, filler_count
+        )
+        SELECT id, question_id, date(created_at, 'localtime'), ?2, ?3, ?4, ?5
+        FROM answers
+        WHERE id = ?1
+        ON CONFLICT (answer_id) DO UPDATE SET
+            question_id = excluded.question_id,
+            period = excluded.period,
+            word_count = excluded.word_count,
+            unique_word_count = excluded.unique_word_count,
+            sentence_count = excluded.sentence_count,
+            filler_count = excluded.filler_count
+    ''', rows)
+
+
+def rebuild_answer_analytics(conn: sqlite3.Connection) -> None:
+    """answers 테이블 전체를 다시 토큰화해 답변 분석 결과와 집계 테이블을 다시 계산합니다."""
+    conn.execute("DELETE FROM answer_features")
+    conn.execute("DELETE FROM question_analytics")
+    conn.execute("DELETE FROM period_analytics")
+
+    # 질문이 없는 답변은 집계/색인하지 않음
+    cursor = conn.execute('''
+        SELECT id, answer FROM answers
+        WHERE question_id IN (SELECT id FROM questions)
+        ORDER BY id
+    ''')
+    while True:
+        batch = [(row[0], row[1]) for row in islice(cursor, ANALYTICS_BATCH_SIZE)]
+        if not batch:
+            break
+        save_answer_features(conn, batch)
+
+
+def _add_answer_analytics(conn: sqlite3.Connection) -> None:
+    """답변별 텍스트 분석 결과와 트리거로 갱신되는 질문별/기간(일)별 집계 테이블을 추가합니다."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS answer_features (
+            answer_id INTEGER PRIMARY KEY,
+            question_id INTEGER NOT NULL,
+            period TEXT NOT NULL,
+            word_count INTEGER NOT NULL,
+            unique_word_count INTEGER NOT NULL,
+            sentence_count INTEGER NOT NULL,
+            filler_count INTEGER NOT NULL,
+            FOREIGN KEY (answer_id) REFERENCES answers (id) ON DELETE CASCADE
+        )
+    ''')
+
+    aggregate_columns = '''
+            answer_count INTEGER NOT NULL DEFAULT 0,
+            word_sum INTEGER NOT NULL DEFAULT 0,
+            unique_word_sum INTEGER NOT NULL DEFAULT 0,
+            sentence_sum INTEGER NOT NULL DEFAULT 0,
+            filler_sum INTEGER NOT NULL DEFAULT 0
+    '''
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS question_analytics (
+            question_id INTEGER PRIMARY KEY,
+            {aggregate_columns},
+            FOREIGN KEY (question_id) REFERENCES questions (id) ON DELETE CASCADE
+        )
+    ''')
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS period_analytics (
+            period TEXT PRIMARY KEY,
+            {aggregate_columns}
+        )
+    ''')
+
+    # 집계 테이블마다 (키 컬럼, answer_features의 키) 쌍으로 같은 형태의 트리거 생성
+    for table, key in (("question_analytics", "question_id"), ("period_analytics", "period")):
+        add_row = f'''
+            INSERT INTO {table} (
+                {key}, answer_count, word_sum, unique_word_sum, sentence_sum, filler_sum
+            )
+            VALUES (
+                NEW.{key}, 1, NEW.word_count, NEW.unique_word_count, NEW.sentence_count, NEW.filler_count
+            )
+            ON CONFLICT ({key}) DO UPDATE SET
+                answer_count = answer_count + 1,
+                word_sum = word_sum + NEW.word_count,
+                unique_word_sum = unique_word_sum + NEW.unique_word_count,
+                sentence_sum = sentence_sum + NEW.sentence_count,
+                filler_sum = filler_sum + NEW.filler_count;
+        '''
+        remove_row = f'''
+            UPDATE {table} SET
+                answer_count = answer_count - 1,
+                word_sum = word_sum - OLD.word_count,
+                unique_word_sum = unique_word_sum - OLD.unique_word_count,
+                sentence_sum = sentence_sum - OLD.sentence_count,
+                filler_sum = filler_sum - OLD.filler_count
+            WHERE {key} = OLD.{key};
+        '''
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_answer_features_{table}_insert
+            AFTER INSERT ON answer_features
+            BEGIN
+                {add_row}
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_answer_features_{table}_delete
+            AFTER DELETE ON answer_features
+            BEGIN
+                {remove_row}
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_answer_features_{table}_update
+            AFTER UPDATE ON answer_features
+            BEGIN
+                {remove_row}
+                {add_row}
+            END
+        ''')
+
+    # 기존 답변 분석
+    rebuild_answer_analytics(conn)
+
+
+def save_answer_signatures(conn: sqlite3.Connection, answers: Iterable[Tuple[int, str]]) -> None:
+    """
+    답변의 MinHash 서명과 LSH 버킷을 저장합니다 (기존 값은 교체).
+
+    단어가 없는 답변은 색인하지 않으며, 이전에 저장된 서명과 버킷도 삭제합니다.
+
+    Args:
+        conn: 데이터베이스 연결
+        answers: (답변 ID, 답변 내용) 튜플 목록
+    """
+    # 같은 답변이 여러 번 전달되면 마지막 내용으로 색인
+    latest = dict(answers)
+    answer_ids = [(answer_id,) for answer_id in latest]
+    signatures = []
+    buckets = []
+    for answer_id, text in latest.items():
+        signature = minhash_signature(text)
+        if signature is None:
+            continue
+        signatures.append((answer_id, pack_signature(signature)))
+        buckets.extend((answer_id, band, bucket) for band, bucket in enumerate(band_buckets(signature)))
+
+    # 서명을 만들지 못한 답변도 이전 값이 남지 않도록 전달된 모든 답변의 기존 값을 삭제
+    conn.executemany("DELETE FROM answer_lsh_buckets WHERE answer_id = ?", answer_ids)
+    conn.executemany("DELETE FROM answer_minhash WHERE answer_id = ?", answer_ids)
+    conn.executemany('''
+        INSERT INTO answer_minhash (answer_id, question_id, signature)
+        SELECT id, question_id, ?2
+        FROM answers
+        WHERE id = ?1
+    ''', signatures)
+    conn.executemany('''
+        INSERT INTO answer_lsh_buckets (question_id, band, bucket, answer_id)
+        SELECT question_id, ?2, ?3, id
+        FROM answers
+        WHERE id = ?1
+    ''', buckets)
+
+
+def rebuild_answer_signatures(conn: sqlite3.Connection) -> None:
+    """answers 테이블 전체의 MinHash 서명과 LSH 버킷을 다시 계산합니다."""
+    conn.execute("DELETE FROM answer_lsh_buckets")
+    conn.execute("DELETE FROM answer_minhash")
+
+    # 질문이 없는 답변은 집계/색인하지 않음
+    cursor = conn.execute('''
+        SELECT id, answer FROM answers
+        WHERE question_id IN (SELECT id FROM questions)
+        ORDER BY id
+    ''')
+    while True:
+        batch = [(row[0], row[1]) for row in islice(cursor, ANALYTICS_BATCH_SIZE)]
+        if not batch:
+            break
+        save_answer_signatures(conn, batch)
+
+
+def _add_answer_similarity_index(conn: sqlite3.Connection) -> None:
+    """거의 같은 답변을 찾기 위한 MinHash 서명과 질문별 LSH 버킷 테이블을 추가합니다."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS answer_minhash (
+            answer_id INTEGER PRIMARY KEY,
+            question_id INTEGER NOT NULL,
+            signature BLOB NOT NULL,
+            FOREIGN KEY (answer_id) REFERENCES answers (id) ON DELETE CASCADE
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS answer_lsh_buckets (
+            question_id INTEGER NOT NULL,
+            band INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            answer_id INTEGER NOT NULL,
+            PRIMARY KEY (question_id, band, bucket, answer_id),
+            FOREIGN KEY (answer_id) REFERENCES answers (id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+    ''')
+    # 답변 삭제(CASCADE) 시 버킷 행을 찾기 위한 인덱스
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_answer_lsh_buckets_answer
+        ON answer_lsh_buckets (answer_id)
+    ''')
+
+    # 기존 답변 색인
+    rebuild_answer_signatures(conn)
+
+
+def _use_local_answer_periods(conn: sqlite3.Connection) -> None:
+    """
+    기존 답변 분석 결과의 기간을 UTC 날짜에서 현지 시간 날짜로 바꿉니다.
+
+    answer_features UPDATE 트리거가 이전 기간에서 빼고 새 기간에 더하므로 집계도 함께 옮겨집니다.
+    """
+    conn.execute('''
+        UPDATE answer_features
+        SET period = (
+            SELECT date(created_at, 'localtime') FROM answers WHERE answers.id = answer_features.answer_id
+        )
+        WHERE period != (
+            SELECT date(created_at, 'localtime') FROM answers WHERE answers.id = answer_features.answer_id
+        )
+    ''')
+    # 답변이 하나도 남지 않은 기간 정리
+    conn.execute("DELETE FROM period_analytics WHERE answer_count = 0")
+
+
+def _drop_question_text_index(conn: sqlite3.Connection) -> None:
+    """더 이상 쓰지 않는 질문 내용 인덱스(idx_questions_question)를 삭제합니다."""
+    conn.execute("DROP INDEX IF EXISTS idx_questions_question")
+
+
+def _add_cache_version(conn: sqlite3.Connection) -> None:
+    """
+    읽기 캐시 무효화용 버전 테이블과, 질문/답변이 바뀔 때 버전을 올리는 트리거를 추가합니다.
+
+    질문 목록/통계/분석 읽기 캐시는 이 버전이 바뀌었을 때만 비워지므로,
+    초안/연습 세션/조언 캐시처럼 관련 없는 테이블의 쓰기는 캐시에 영향을 주지 않습니다.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS cache_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL
+        )
+    ''')
+    conn.execute("INSERT OR IGNORE INTO cache_version (id, version) VALUES (1, 0)")
+
+    for table in ("questions", "answers"):
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_cache_version_{event.lower()}
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE cache_version SET version = version + 1 WHERE id = 1;
+                END
+            ''')
+
+
+def get_cache_version(conn: sqlite3.Connection) -> int:
+    """읽기 캐시 무효화용 버전을 반환합니다."""
+    return conn.execute("SELECT version FROM cache_version WHERE id = 1").fetchone()[0]
+
+
+def bump_cache_version(conn: sqlite3.Connection) -> None:
+    """
+    질문/답변을 직접 바꾸지 않고 통계/분석 테이블만 다시 계산했을 때 캐시 버전을 올립니다.
+
+    다른 프로세스에서 실행 중인 앱의 읽기 캐시가 다시 계산된 값을 읽도록 합니다.
+    """
+    conn.execute("UPDATE cache_version SET version = version + 1 WHERE id = 1")
+
+
+# 순서대로 적용되는 마이그레이션 목록 (인덱스 + 1 = 스키마 버전)
+MIGRATIONS: List[Callable[[sqlite3.Connection], None]] = [
+    _create_base_tables,
+    _add_lookup_indexes,
+    _add_question_stats,
+    _add_advice_cache,
+    _add_answer_advice,
+    _add_full_text_search,
+    _add_question_schedule,
+    _add_question_text_index,
+    _add_practice_sessions,
+    _add_drafts,
+    _add_answer_analytics,
+    _add_answer_similarity_index,
+    _use_local_answer_periods,
+    _drop_question_text_index,
+    _add_cache_version,
+]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """PRAGMA user_version에 기록된 현재 스키마 버전을 반환합니다."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    아직 적용되지 않은 마이그레이션을 버전 순서대로 적용합니다.
+
+    각 마이그레이션은 user_version 갱신과 함께 하나의 트랜잭션으로 실행됩니다.
+
+    Args:
+        conn: 데이터베이스 연결
+
+    Returns:
+        마이그레이션 후 스키마 버전
+    """
+    current_version = get_schema_version(conn)
+
+    for version, migration in enumerate(MIGRATIONS, start=1):
+        if version <= current_version:
+            continue
+
+        if conn.in_transaction:
+            conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 다른 프로세스가 먼저 적용했는지 잠금 획득 후 다시 확인
+            if get_schema_version(conn) >= version:
+                conn.commit()
+                current_version = version
+                continue
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        current_version = version
+
+    return current_version
@@ -0,0 +1,169 @@
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+# 합성 응답 (재생 파일이 없거나 일치하는 프롬프트가 없을 때 사용)
+SYNTHETIC_RESPONSE = """### 1. 학생 문단 전체 수정본
+This is a synthetic response generated by the local mock backend. It does not reflect the student's answer.
+
+---
+
+### 2. 수정 문장 및 어휘 설명
+#### 1. "This is a synthetic response."
+- 수정 전: "This is synthetic response."
+- 수정 후: "This is a synthetic response."
+
+**어휘 설명:**
+- 단수 가산 명사 앞에는 관사 a/an이 필요합니다.
+"""
+
+# 공백을 포함한 단어 단위로 응답을 토큰처럼 나눔
+_TOKEN_PATTERN = re.compile(r"\s*\S+")
+
+
+@dataclass
+class MockMessage:
+    """AIMessage / AIMessageChunk와 같은 content / usage_metadata 속성을 갖는 응답 객체"""
+
+    content: str
+    usage_metadata: Optional[Dict[str, int]] = None
+
+
+def _prompt_text(prompt) -> str:
+    return prompt if isinstance(prompt, str) else json.dumps(prompt, default=str, ensure_ascii=False)
+
+
+def _prompt_hash(prompt) -> str:
+    return hashlib.sha256(_prompt_text(prompt).encode("utf-8")).hexdigest()
+
+
+def _usage(prompt, tokens: List[str]) -> Dict[str, int]:
+    """단어 단위로 센 토큰 수로 usage_metadata를 만듭니다."""
+    input_tokens = len(_TOKEN_PATTERN.findall(_prompt_text(prompt)))
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": len(tokens),
+        "total_tokens": input_tokens + len(tokens),
+    }
+
+
+class MockChatModel:
+    """
+    네트워크 없이 AzureChatOpenAI를 대신하는 로컬 모의 백엔드
+
+    invoke / stream / ainvoke / astream을 제공하며, 지연 시간(첫 토큰까지)과
+    토큰 생성 속도를 정규 분포에서 샘플링해 실제 호출과 비슷한 타이밍을 재현합니다.
+    배치 작업과 Streamlit 스크립트 스레드가 함께 호출하므로 난수 생성기와 재생 순서는 잠금으로 보호합니다.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 800.0,
+        latency_jitter_ms: float = 200.0,
+        tokens_per_second: float = 40.0,
+        tokens_per_second_jitter: float = 5.0,
+        replay_file: Optional[str] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        모의 백엔드 초기화
+
+        Args:
+            latency_ms: 첫 토큰까지의 평균 지연 시간 (밀리초)
+            latency_jitter_ms: 지연 시간의 표준 편차 (밀리초)
+            tokens_per_second: 평균 토큰 생성 속도
+            tokens_per_second_jitter: 토큰 생성 속도의 표준 편차
+            replay_file: 기록된 응답 JSONL 파일 경로
+                (각 줄: {"response": ...} 또는 {"prompt_sha256": ..., "response": ...})
+            seed: 난수 시드 (재현 가능한 벤치마크용, 동시 호출 시에는 호출 순서에 따라 달라짐)
+        """
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.tokens_per_second = tokens_per_second
+        self.tokens_per_second_jitter = tokens_per_second_jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._responses_by_hash: Dict[str, str] = {}
+        self._responses: List[str] = []
+        self._next_response = 0
+        if replay_file:
+            self._load_replay_file(replay_file)
+
+    @classmethod
+    def from_env(cls) -> "MockChatModel":
+        """MOCK_LLM_* 환경 변수로 모의 백엔드를 만듭니다."""
+        seed = os.getenv("MOCK_LLM_SEED")
+        return cls(
+            latency_ms=float(os.getenv("MOCK_LLM_LATENCY_MS", "800")),
+            latency_jitter_ms=float(os.getenv("MOCK_LLM_LATENCY_JITTER_MS", "200")),
+            tokens_per_second=float(os.getenv("MOCK_LLM_TOKENS_PER_SECOND", "40")),
+            tokens_per_second_jitter=float(os.getenv("MOCK_LLM_TOKENS_PER_SECOND_JITTER", "5")),
+            replay_file=os.getenv("MOCK_LLM_REPLAY_FILE"),
+            seed=int(seed) if seed else None,
+        )
+
+    def _load_replay_file(self, replay_file: str) -> None:
+        with open(replay_file, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("prompt_sha256"):
+                    self._responses_by_hash[record["prompt_sha256"]] = record["response"]
+                else:
+                    self._responses.append(record["response"])
+
+    def _pick_response(self, prompt) -> str:
+        """프롬프트 해시가 일치하는 기록 → 순환 재생 기록 → 합성 응답 순서로 응답을 고릅니다."""
+        response = self._responses_by_hash.get(_prompt_hash(prompt))
+        if response is not None:
+            return response
+        if self._responses:
+            with self._lock:
+                response = self._responses[self._next_response % len(self._responses)]
+                self._next_response += 1
+            return response
+        return SYNTHETIC_RESPONSE
+
+    def _plan(self, prompt):
+        """응답 토큰 목록, 첫 토큰 지연(초), 토큰 간 간격(초)을 샘플링합니다."""
+        tokens = _TOKEN_PATTERN.findall(self._pick_response(prompt))
+        with self._lock:
+            latency = max(0.0, self._random.gauss(self.latency_ms, self.latency_jitter_ms)) / 1000
+            rate = max(1.0, self._random.gauss(self.tokens_per_second, self.tokens_per_second_jitter))
+        return tokens, latency, 1.0 / rate
+
+    def invoke(self, prompt) -> MockMessage:
+        tokens, latency, interval = self._plan(prompt)
+        time.sleep(latency + interval * len(tokens))
+        return MockMessage(content="".join(tokens), usage_metadata=_usage(prompt, tokens))
+
+    def stream(self, prompt) -> Iterator[MockMessage]:
+        tokens, latency, interval = self._plan(prompt)
+        time.sleep(latency)
+        for token in tokens:
+            yield MockMessage(content=token)
+            time.sleep(interval)
+        # 실제 API처럼 마지막 빈 조각에 토큰 사용량을 담음
+        yield MockMessage(content="", usage_metadata=_usage(prompt, tokens))
+
+    async def ainvoke(self, prompt) -> MockMessage:
+        tokens, latency, interval = self._plan(prompt)
+        await asyncio.sleep(latency + interval * len(tokens))
+        return MockMessage(content="".join(tokens), usage_metadata=_usage(prompt, tokens))
+
+    async def astream(self, prompt) -> AsyncIterator[MockMessage]:
+        tokens, latency, interval = self._plan(prompt)
+        await asyncio.sleep(latency)
+        for token in tokens:
+            yield MockMessage(content=token)
+            await asyncio.sleep(interval)
+        yield MockMessage(content="", usage_metadata=_usage(prompt, tokens))
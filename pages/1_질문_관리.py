@@ -1,150 +1,38 @@
 import streamlit as st
 import sqlite3
+import io
 from typing import List, Dict, Optional
+from repository import QuestionRepository
+from ai_service import AzureOpenAIService
+from advice_cache import AdviceCache
+from debug_panel import begin_instrumented_run, render_debug_panel
+from batch_advice import run_advice_batch
+from bank_io import ANSWER_FIELDS, QUESTION_FIELDS, detect_format, read_questions, write_rows
 
 # 데이터베이스 파일 경로
 DB_PATH = "questions.db"
 
-def get_all_questions() -> List[Dict]:
-    """데이터베이스에서 모든 질문을 가져옵니다."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute("SELECT id, question, type, created_at FROM questions ORDER BY id")
-    questions = [
-        {
-            "id": row["id"],
-            "question": row["question"],
-            "type": row["type"],
-            "created_at": row["created_at"]
-        }
-        for row in cursor.fetchall()
-    ]
-    
-    conn.close()
-    return questions
+# 질문 상세 화면에서 한 번에 표시할 답변 수
+ANSWER_PAGE_SIZE = 20
 
-def add_question(question: str) -> bool:
-    """새 질문을 데이터베이스에 추가합니다."""
-    if not question.strip():
-        return False
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute("INSERT INTO questions (question) VALUES (?)", (question,))
-    
-    conn.commit()
-    conn.close()
-    return True
-
-def get_question_avg_difficulty(question_id: int) -> Optional[float]:
-    """질문의 평균 난이도를 계산합니다."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT AVG(difficulty) as avg_difficulty, COUNT(*) as count
-        FROM answers
-        WHERE question_id = ?
-    ''', (question_id,))
-    
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row and row[0] is not None:
-        return round(row[0], 2)
-    return None
-
-def get_question_answers(question_id: int) -> List[Dict]:
-    """특정 질문의 모든 답변을 가져옵니다."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT id, answer, difficulty, created_at
-        FROM answers
-        WHERE question_id = ?
-        ORDER BY created_at DESC
-    ''', (question_id,))
-    
-    answers = [
-        {
-            "id": row["id"],
-            "answer": row["answer"],
-            "difficulty": row["difficulty"],
-            "created_at": row["created_at"]
-        }
-        for row in cursor.fetchall()
-    ]
-    
-    conn.close()
-    return answers
+# 검색 결과 최대 표시 수
+SEARCH_RESULT_LIMIT = 20
 
-def delete_question(question_id: int) -> bool:
-    """질문을 삭제합니다 (CASCADE로 관련 답변도 삭제됨)."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute("DELETE FROM questions WHERE id = ?", (question_id,))
-    
-    conn.commit()
-    conn.close()
-    return True
-
-def add_answer(question_id: int, answer: str, difficulty: int) -> bool:
-    """새 답변을 데이터베이스에 추가합니다."""
-    if not answer.strip():
-        return False
-    
-    if difficulty < 1 or difficulty > 5:
-        return False
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        INSERT INTO answers (question_id, answer, difficulty) 
-        VALUES (?, ?, ?)
-    ''', (question_id, answer, difficulty))
-    
-    conn.commit()
-    conn.close()
-    return True
-
-def update_answer(answer_id: int, answer: str, difficulty: int) -> bool:
-    """답변을 수정합니다."""
-    if not answer.strip():
-        return False
-    
-    if difficulty < 1 or difficulty > 5:
-        return False
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        UPDATE answers 
-        SET answer = ?, difficulty = ?
-        WHERE id = ?
-    ''', (answer, difficulty, answer_id))
-    
-    conn.commit()
-    conn.close()
-    return True
-
-def delete_answer(answer_id: int) -> bool:
-    """답변을 삭제합니다."""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute("DELETE FROM answers WHERE id = ?", (answer_id,))
-    
-    conn.commit()
-    conn.close()
-    return True
+# 이번 실행(rerun)의 쿼리/AI 호출 기록 시작
+run_stats = begin_instrumented_run()
+
+@st.cache_resource
+def get_question_repository() -> QuestionRepository:
+    """서버 프로세스 전체에서 공유되는 Repository 인스턴스를 반환합니다."""
+    return QuestionRepository(DB_PATH)
+
+# Repository 인스턴스 (연결 풀 공유)
+question_repository = get_question_repository()
+
+@st.cache_resource
+def get_ai_service() -> AzureOpenAIService:
+    """서버 프로세스 전체에서 클라이언트(HTTP 연결 풀)와 응답 캐시를 공유하는 AI 서비스를 반환합니다."""
+    return AzureOpenAIService(cache=AdviceCache(DB_PATH))
 
 def main():
     st.title("📝 질문 관리")
@@ -164,7 +52,7 @@ def main():
             with col1:
                 if st.button("추가", type="primary"):
                     if new_question.strip():
-                        if add_question(new_question.strip()):
+                        if question_repository.add_question(new_question.strip()):
                             st.success("질문이 추가되었습니다!")
                             st.rerun()
                         else:
@@ -172,8 +60,112 @@ def main():
                     else:
                         st.warning("질문 내용을 입력해주세요.")
         
-        st.markdown("---")
+        # 질문 은행 가져오기/내보내기 섹션 (CSV/JSONL)
+        with st.expander("📥 가져오기 / 📤 내보내기", expanded=False):
+            st.caption("CSV는 question, type 컬럼, JSONL은 줄마다 {\"question\": ..., \"type\": ...} 형식입니다. 이미 있는 질문은 건너뜁니다.")
+            uploaded_file = st.file_uploader("질문 파일 가져오기", type=["csv", "jsonl"], key="import_file")
+            if uploaded_file is not None and st.button("가져오기", type="primary", key="import_btn"):
+                try:
+                    fmt = detect_format(uploaded_file.name)
+                    # 업로드 파일을 한 줄씩 읽어 배치 단위로 저장
+                    text_stream = io.TextIOWrapper(uploaded_file, encoding="utf-8-sig", newline="")
+                    result = question_repository.import_questions(read_questions(text_stream, fmt))
+                    st.success(
+                        f"가져오기 완료: 추가 {result['inserted']}개, "
+                        f"중복 {result['duplicates']}개, 빈 질문 {result['skipped']}개"
+                    )
+                except ValueError as e:
+                    st.error(str(e))
+
+            export_format = st.radio("내보내기 형식", options=["csv", "jsonl"], horizontal=True, key="export_format")
+            # 다운로드 버튼은 파일 내용 전체를 메모리에 올리므로, 큰 데이터는 CLI로 파일에 바로 기록
+            st.caption("데이터가 많으면 `python bank_io.py export-questions|export-answers <경로>`로 내보내세요 (한 행씩 파일에 기록).")
+            export_col1, export_col2 = st.columns(2)
+            with export_col1:
+                if st.button("질문 내보내기 준비", key="prepare_export_questions"):
+                    buffer = io.StringIO()
+                    write_rows(question_repository.iter_questions(), buffer, export_format, QUESTION_FIELDS)
+                    st.session_state.export_questions_data = (export_format, buffer.getvalue())
+                if "export_questions_data" in st.session_state:
+                    fmt, data = st.session_state.export_questions_data
+                    st.download_button("⬇️ 질문 다운로드", data=data, file_name=f"questions.{fmt}", key="download_questions")
+            with export_col2:
+                if st.button("답변 기록 내보내기 준비", key="prepare_export_answers"):
+                    buffer = io.StringIO()
+                    write_rows(question_repository.iter_answer_history(), buffer, export_format, ANSWER_FIELDS)
+                    st.session_state.export_answers_data = (export_format, buffer.getvalue())
+                if "export_answers_data" in st.session_state:
+                    fmt, data = st.session_state.export_answers_data
+                    st.download_button("⬇️ 답변 기록 다운로드", data=data, file_name=f"answers.{fmt}", key="download_answers")
         
+        # 여러 질문 일괄 추가 섹션 (한 줄에 질문 하나, 하나의 트랜잭션으로 저장)
+        with st.expander("📚 여러 질문 한 번에 추가", expanded=False):
+            bulk_questions = st.text_area(
+                "질문을 한 줄에 하나씩 입력하세요:",
+                height=200,
+                placeholder="What is your favorite hobby and why?\nDescribe a memorable trip you've taken.",
+                key="bulk_question_input"
+            )
+            bulk_question_type = st.text_input(
+                "질문 유형 (선택)",
+                placeholder="예: home",
+                key="bulk_question_type"
+            )
+            
+            if st.button("일괄 추가", type="primary", key="bulk_add_btn"):
+                lines = [line.strip() for line in bulk_questions.splitlines() if line.strip()]
+                if lines:
+                    question_type = bulk_question_type.strip() or None
+                    added = question_repository.add_questions_bulk((line, question_type) for line in lines)
+                    st.success(f"{added}개의 질문이 추가되었습니다!")
+                    st.rerun()
+                else:
+                    st.warning("질문 내용을 입력해주세요.")
+
+        # 중복 답변 정리 섹션 (같은 질문에 거의 같은 답변을 여러 번 저장한 경우 하나로 합침)
+        with st.expander("🧹 중복 답변 정리", expanded=False):
+            st.caption("같은 질문에 저장된 답변 중 내용이 거의 같은 답변끼리 묶어 보여줍니다.")
+
+            if st.button("중복 답변 찾기", key="find_duplicates_btn"):
+                st.session_state.duplicate_groups = question_repository.find_duplicate_groups()
+
+            duplicate_groups = st.session_state.get("duplicate_groups")
+            if duplicate_groups is not None:
+                if not duplicate_groups:
+                    st.info("거의 같은 답변이 없습니다.")
+                else:
+                    st.write(f"{len(duplicate_groups)}개 그룹, 중복 답변 {sum(len(g['answers']) - 1 for g in duplicate_groups)}개")
+
+                    keep_ids = []
+                    for group in duplicate_groups:
+                        answers = group["answers"]
+                        st.markdown(f"**{group['question']}**")
+                        # 기본값: 조언이 있는 답변 중 가장 최근 답변, 없으면 가장 최근 답변
+                        with_advice = [i for i, a in enumerate(answers) if a["has_advice"]]
+                        default_index = with_advice[-1] if with_advice else len(answers) - 1
+                        keep_index = st.radio(
+                            "남길 답변",
+                            options=range(len(answers)),
+                            index=default_index,
+                            format_func=lambda i, answers=answers: (
+                                f"{answers[i]['created_at']} · 난이도 {answers[i]['difficulty']}"
+                                f"{' · 💬 조언' if answers[i]['has_advice'] else ''} · {answers[i]['preview']}"
+                            ),
+                            key=f"duplicate_keep_{answers[0]['id']}",
+                        )
+                        keep_ids.append((answers[keep_index]["id"], [a["id"] for a in answers]))
+
+                    if st.button("선택한 답변만 남기고 합치기", type="primary", key="merge_duplicates_btn"):
+                        deleted = sum(
+                            question_repository.merge_duplicate_answers(keep_id, answer_ids)
+                            for keep_id, answer_ids in keep_ids
+                        )
+                        del st.session_state.duplicate_groups
+                        st.success(f"중복 답변 {deleted}개를 정리했습니다!")
+                        st.rerun()
+
+        st.markdown("---")
+
         # --- 메인 화면: 질문 목록 / 상세 보기 토글 ---
         selected_question_id = st.session_state.get("selected_question_id")
 
@@ -186,16 +178,15 @@ def main():
 
             st.markdown("---")
 
-            # 선택된 질문 정보 및 답변 로드
-            questions = get_all_questions()
-            question = next((q for q in questions if q["id"] == selected_question_id), None)
+            # 선택된 질문 정보 및 통계 로드 (답변 본문은 화면에 표시할 때만 조회)
+            question = question_repository.get_question_stats_by_id(selected_question_id)
 
             if question is None:
                 st.error("선택한 질문을 찾을 수 없습니다.")
                 return
 
-            avg_difficulty = get_question_avg_difficulty(selected_question_id)
-            answers = get_question_answers(selected_question_id)
+            avg_difficulty = question["avg_difficulty"]
+            answers_count = question["answers_count"]
 
             # 질문 정보
             st.subheader(f"질문 {selected_question_id}")
@@ -221,7 +212,49 @@ def main():
                     st.caption("(답변 없음)")
 
             with col2:
-                st.metric("총 답변 수", len(answers))
+                st.metric("총 답변 수", answers_count)
+
+            st.markdown("---")
+
+            # AI 조언 일괄 생성 섹션
+            with st.expander("🤖 AI 조언 일괄 생성", expanded=False):
+                missing_count = question_repository.count_answers_without_advice(selected_question_id)
+                st.caption(f"조언이 없는 답변: {missing_count}개 / 전체 {answers_count}개")
+                regenerate_all = st.checkbox(
+                    "이미 조언이 있는 답변도 다시 생성",
+                    key=f"batch_advice_all_{selected_question_id}",
+                )
+                concurrency = st.slider(
+                    "동시 요청 수",
+                    min_value=1,
+                    max_value=16,
+                    value=4,
+                    key=f"batch_advice_concurrency_{selected_question_id}",
+                )
+
+                if st.button("조언 생성 시작", type="primary", key=f"batch_advice_btn_{selected_question_id}"):
+                    progress_bar = st.progress(0.0)
+                    progress_text = st.empty()
+
+                    def update_progress(done: int, total: int):
+                        progress_bar.progress(done / total)
+                        progress_text.caption(f"진행률: {done} / {total}")
+
+                    summary = run_advice_batch(
+                        question_repository,
+                        get_ai_service(),
+                        question_id=selected_question_id,
+                        only_missing=not regenerate_all,
+                        concurrency=concurrency,
+                        on_progress=update_progress,
+                    )
+
+                    if summary["total"] == 0:
+                        st.info("조언을 생성할 답변이 없습니다.")
+                    elif summary["failed"]:
+                        st.warning(f"성공 {summary['succeeded']}개, 실패 {summary['failed']}개")
+                    else:
+                        st.success(f"{summary['succeeded']}개 답변의 조언이 저장되었습니다!")
 
             st.markdown("---")
 
@@ -253,7 +286,13 @@ def main():
                 
                 if st.button("답변 추가", type="primary", key=f"add_answer_btn_{selected_question_id}"):
                     if new_answer_text.strip():
-                        if add_answer(selected_question_id, new_answer_text.strip(), new_answer_difficulty):
+                        similar_answers = question_repository.find_similar_answers(selected_question_id, new_answer_text.strip())
+                        if question_repository.add_answer(selected_question_id, new_answer_text.strip(), new_answer_difficulty):
+                            if similar_answers:
+                                st.toast(
+                                    f"이전 답변과 거의 같은 답변입니다 (유사도 {similar_answers[0]['similarity']:.0%}).",
+                                    icon="♻️",
+                                )
                             st.success("답변이 추가되었습니다!")
                             st.rerun()
                         else:
@@ -266,11 +305,25 @@ def main():
             # 답변 목록
             st.subheader("📋 답변 목록")
 
-            if not answers:
+            if answers_count == 0:
                 st.info("이 질문에 대한 답변이 아직 없습니다.")
                 st.caption("위의 '새 답변 추가'를 사용하여 답변을 추가할 수 있습니다.")
             else:
-                for idx, answer in enumerate(answers, 1):
+                # 답변 페이지 커서 스택 (질문별로 관리, 첫 페이지는 None)
+                answer_cursors_key = f"answer_page_cursors_{selected_question_id}"
+                if answer_cursors_key not in st.session_state:
+                    st.session_state[answer_cursors_key] = [None]
+                answer_cursors = st.session_state[answer_cursors_key]
+
+                # 현재 페이지의 답변 메타데이터만 조회 (본문은 펼치거나 수정할 때 조회)
+                answer_summaries, next_answer_cursor = question_repository.get_answer_summaries_page(
+                    selected_question_id,
+                    after=answer_cursors[-1],
+                    limit=ANSWER_PAGE_SIZE,
+                )
+                page_offset = (len(answer_cursors) - 1) * ANSWER_PAGE_SIZE
+
+                for idx, summary in enumerate(answer_summaries, 1):
                     difficulty_labels = {
                         1: "매우 쉬움",
                         2: "쉬움",
@@ -278,21 +331,30 @@ def main():
                         4: "어려움",
                         5: "매우 어려움",
                     }
-                    difficulty_label = difficulty_labels.get(answer["difficulty"], "보통")
+                    difficulty_label = difficulty_labels.get(summary["difficulty"], "보통")
                     
-                    answer_id = answer["id"]
+                    answer_id = summary["id"]
                     edit_key = f"edit_mode_{answer_id}"
+                    expand_key = f"answer_expanded_{answer_id}"
                     is_editing = st.session_state.get(edit_key, False)
+                    is_expanded = st.session_state.get(expand_key, False)
+
+                    # 펼쳐졌거나 수정 중인 답변만 전체 본문 조회
+                    answer = question_repository.get_answer(answer_id) if (is_editing or is_expanded) else None
 
                     with st.container():
                         header_col1, header_col2, header_col3 = st.columns([3, 1, 1])
                         with header_col1:
-                            st.markdown(f"**답변 {idx}**")
+                            st.checkbox(
+                                f"**답변 {page_offset + idx}** ({summary['length']}자)",
+                                key=f"select_answer_{answer_id}",
+                            )
                         with header_col2:
-                            st.markdown(f"난이도: **{answer['difficulty']}** ({difficulty_label})")
+                            st.markdown(f"난이도: **{summary['difficulty']}** ({difficulty_label})")
                         with header_col3:
                             if not is_editing:
                                 if st.button("✏️ 수정", key=f"edit_btn_{answer_id}"):
+                                    answer = question_repository.get_answer(answer_id)
                                     st.session_state[edit_key] = True
                                     st.session_state[f"edit_answer_{answer_id}"] = answer["answer"]
                                     st.session_state[f"edit_difficulty_{answer_id}"] = answer["difficulty"]
@@ -324,7 +386,7 @@ def main():
                             with col1:
                                 if st.button("💾 저장", type="primary", key=f"save_btn_{answer_id}"):
                                     if edited_answer.strip():
-                                        if update_answer(answer_id, edited_answer.strip(), edited_difficulty):
+                                        if question_repository.update_answer(answer_id, edited_answer.strip(), edited_difficulty):
                                             st.success("답변이 수정되었습니다!")
                                             st.session_state[edit_key] = False
                                             st.rerun()
@@ -334,7 +396,7 @@ def main():
                                         st.warning("답변 내용을 입력해주세요.")
                             with col2:
                                 if st.button("🗑️ 삭제", key=f"delete_btn_{answer_id}"):
-                                    if delete_answer(answer_id):
+                                    if question_repository.delete_answer(answer_id):
                                         st.success("답변이 삭제되었습니다!")
                                         st.session_state[edit_key] = False
                                         st.rerun()
@@ -342,51 +404,141 @@ def main():
                                         st.error("답변 삭제 중 오류가 발생했습니다.")
                         else:
                             # 읽기 모드
-                            st.text_area(
-                                "답변 내용",
-                                value=answer["answer"],
-                                height=200,
-                                disabled=True,
-                                key=f"answer_view_{answer_id}",
-                            )
+                            if is_expanded:
+                                st.text_area(
+                                    "답변 내용",
+                                    value=answer["answer"],
+                                    height=200,
+                                    disabled=True,
+                                    key=f"answer_view_{answer_id}",
+                                )
+                            else:
+                                preview = summary["preview"]
+                                if summary["length"] > len(preview):
+                                    preview += "…"
+                                st.text(preview)
                             
-                            # 삭제 버튼 (읽기 모드에서도 표시)
-                            if st.button("🗑️ 삭제", key=f"delete_view_btn_{answer_id}"):
-                                if delete_answer(answer_id):
-                                    st.success("답변이 삭제되었습니다!")
+                            view_col1, view_col2 = st.columns([1, 5])
+                            with view_col1:
+                                if st.button("📖 접기" if is_expanded else "📖 전체 보기", key=f"expand_btn_{answer_id}"):
+                                    st.session_state[expand_key] = not is_expanded
                                     st.rerun()
-                                else:
-                                    st.error("답변 삭제 중 오류가 발생했습니다.")
+                            with view_col2:
+                                # 삭제 버튼 (읽기 모드에서도 표시)
+                                if st.button("🗑️ 삭제", key=f"delete_view_btn_{answer_id}"):
+                                    if question_repository.delete_answer(answer_id):
+                                        st.success("답변이 삭제되었습니다!")
+                                        st.rerun()
+                                    else:
+                                        st.error("답변 삭제 중 오류가 발생했습니다.")
                         
-                        st.caption(f"작성일: {answer['created_at']}")
+                        st.caption(f"작성일: {summary['created_at']}")
+
+                        if summary["has_advice"]:
+                            # expander 본문은 닫혀 있어도 실행되므로, 조언을 펼친 답변만 본문 조회
+                            advice_key = f"advice_expanded_{answer_id}"
+                            is_advice_open = st.session_state.get(advice_key, False)
+                            if st.button("💬 조언 접기" if is_advice_open else "💬 오픽 선생님 조언 보기", key=f"advice_btn_{answer_id}"):
+                                st.session_state[advice_key] = not is_advice_open
+                                st.rerun()
+                            if is_advice_open:
+                                if answer is None:
+                                    answer = question_repository.get_answer(answer_id)
+                                if answer is not None and answer["advice"]:
+                                    st.info(answer["advice"])
 
-                        if idx < len(answers):
+                        if idx < len(answer_summaries):
                             st.markdown("---")
 
+                # 선택한 답변 일괄 삭제 (하나의 트랜잭션)
+                selected_answer_ids = [
+                    summary["id"]
+                    for summary in answer_summaries
+                    if st.session_state.get(f"select_answer_{summary['id']}")
+                ]
+                if selected_answer_ids:
+                    st.markdown("---")
+                    if st.button(f"🗑️ 선택한 답변 {len(selected_answer_ids)}개 삭제", key="delete_selected_answers_btn"):
+                        deleted = question_repository.delete_answers_bulk(selected_answer_ids)
+                        for answer_id in selected_answer_ids:
+                            st.session_state.pop(f"select_answer_{answer_id}", None)
+                        st.success(f"{deleted}개의 답변이 삭제되었습니다!")
+                        st.rerun()
+
+                # 답변 페이지 이동
+                if len(answer_cursors) > 1 or next_answer_cursor is not None:
+                    st.markdown("---")
+                    nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
+                    with nav_col1:
+                        if st.button("◀ 이전", disabled=len(answer_cursors) == 1, key="answer_page_prev"):
+                            answer_cursors.pop()
+                            st.rerun()
+                    with nav_col2:
+                        st.caption(f"{len(answer_cursors)} 페이지")
+                    with nav_col3:
+                        if st.button("다음 ▶", disabled=next_answer_cursor is None, key="answer_page_next"):
+                            answer_cursors.append(next_answer_cursor)
+                            st.rerun()
+
         # 2) 질문 목록 화면
         else:
+            # 질문/답변 전문 검색
+            search_query = st.text_input(
+                "🔍 질문/답변 검색",
+                placeholder="검색어를 입력하세요 (예: favorite music)",
+                key="search_query",
+            )
+
+            if search_query.strip():
+                search_results = question_repository.search(search_query, limit=SEARCH_RESULT_LIMIT)
+                question_results = search_results["questions"]
+                answer_results = search_results["answers"]
+
+                if not question_results and not answer_results:
+                    st.info("검색 결과가 없습니다.")
+
+                # bm25 점수는 질문/답변 사이에 비교할 수 없으므로 결과를 나눠 각각 관련도 순으로 표시
+                for title, kind, results in (
+                    ("질문", "question", question_results),
+                    ("답변", "answer", answer_results),
+                ):
+                    if not results:
+                        continue
+                    st.caption(f"{title} 검색 결과: {len(results)}개")
+                    for result in results:
+                        with st.container():
+                            result_col1, result_col2 = st.columns([5, 1])
+                            with result_col1:
+                                if kind == "question":
+                                    st.markdown(f"**질문 {result['question_id']}** : {result['snippet']}")
+                                else:
+                                    st.markdown(f"**질문 {result['question_id']}의 답변** : {result['snippet']}")
+                                    st.caption(result["question"])
+                            with result_col2:
+                                result_key = f"search_result_{kind}_{result['answer_id'] or result['question_id']}"
+                                if st.button("열기", key=result_key):
+                                    st.session_state.selected_question_id = result["question_id"]
+                                    st.rerun()
+
+                st.markdown("---")
+
             # 질문 목록
             st.subheader("📋 질문 목록")
 
-            questions = get_all_questions()
-
-            # st.text(f"questions: {questions}")
+            total_questions = question_repository.count_questions()
 
-            if not questions:
+            if total_questions == 0:
                 st.info("등록된 질문이 없습니다. 위의 '새 질문 추가'를 사용하여 질문을 추가하세요.")
             else:
-                st.text(f"총 질문 수: {len(questions)}")
-
-                # 각 질문에 통계 정보(답변 수, 평균 난이도) 미리 계산
-                question_stats = []
-                for q in questions:
-                    q_id = q["id"]
-                    avg_difficulty = get_question_avg_difficulty(q_id)
-                    answers = get_question_answers(q_id)
-                    q_data = dict(q)
-                    q_data["avg_difficulty"] = avg_difficulty
-                    q_data["answers_count"] = len(answers)
-                    question_stats.append(q_data)
+                st.text(f"총 질문 수: {total_questions}")
+
+                # --- 페이지 상태 관리 (키셋 커서 스택) ---
+                # question_page_cursors[i]: i번째 페이지를 조회할 때 사용하는 커서 (첫 페이지는 None)
+                if "question_page_cursors" not in st.session_state:
+                    st.session_state.question_page_cursors = [None]
+
+                def reset_page():
+                    st.session_state.question_page_cursors = [None]
 
                 # --- 컬럼 헤더 버튼으로 정렬 상태 관리 ---
                 # 정렬 상태 초기값 설정
@@ -398,6 +550,7 @@ def main():
                 def toggle_sort(column_key: str):
                     current_key = st.session_state.question_sort_key
                     current_order = st.session_state.question_sort_order
+                    reset_page()
 
                     if current_key != column_key:
                         # 다른 컬럼을 클릭하면 해당 컬럼 오름차순으로 시작
@@ -466,27 +619,14 @@ def main():
                         toggle_sort("difficulty")
                         st.rerun()
 
-                # 선택된 정렬 기준/순서에 따라 question_stats 정렬
-                if sort_order != "none":
-                    reverse = sort_order == "desc"
-                    if sort_key == "answers":
-                        question_stats.sort(
-                            key=lambda x: x["answers_count"],
-                            reverse=reverse,
-                        )
-                    elif sort_key == "difficulty":
-                        # 평균 난이도가 없는 경우를 위해 기본값 설정
-                        question_stats.sort(
-                            key=lambda x: (
-                                x["avg_difficulty"]
-                                if x["avg_difficulty"] is not None
-                                else -1
-                            ),
-                            reverse=reverse,
-                        )
-                    else:
-                        # 기본: 질문 ID 기준
-                        question_stats.sort(key=lambda x: x["id"], reverse=reverse)
+                # 현재 페이지만 정렬/페이지 조건을 SQL로 처리해 조회
+                page_cursors = st.session_state.question_page_cursors
+                question_stats, next_cursor = question_repository.get_question_stats_page(
+                    sort_key=sort_key if sort_order != "none" else "id",
+                    descending=sort_order == "desc",
+                    after=page_cursors[-1],
+                    limit=st.session_state.get("question_page_size", 50),
+                )
 
                 # 각 질문 카드
                 for question in question_stats:
@@ -528,6 +668,27 @@ def main():
                             else:
                                 st.badge("없음", color="gray", width="content")
 
+                # 페이지 이동
+                st.markdown("---")
+                nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
+                with nav_col1:
+                    if st.button("◀ 이전", disabled=len(page_cursors) == 1, key="question_page_prev"):
+                        page_cursors.pop()
+                        st.rerun()
+                with nav_col2:
+                    st.caption(f"{len(page_cursors)} 페이지")
+                    st.selectbox(
+                        "페이지당 질문 수",
+                        options=[20, 50, 100],
+                        index=1,
+                        key="question_page_size",
+                        on_change=reset_page,
+                    )
+                with nav_col3:
+                    if st.button("다음 ▶", disabled=next_cursor is None, key="question_page_next"):
+                        page_cursors.append(next_cursor)
+                        st.rerun()
+
 
     except sqlite3.OperationalError:
         st.error(f"데이터베이스 파일을 찾을 수 없습니다. 먼저 `python init_db.py`를 실행하여 데이터베이스를 초기화하세요.")
@@ -536,4 +697,5 @@ def main():
 
 if __name__ == "__main__":
     main()
+    render_debug_panel(run_stats)
 
@@ -0,0 +1,123 @@
+import streamlit as st
+import sqlite3
+from repository import QuestionRepository
+from debug_panel import begin_instrumented_run, render_debug_panel
+
+# 데이터베이스 파일 경로
+DB_PATH = "questions.db"
+
+# 질문별 분석에 표시할 최대 질문 수
+QUESTION_ANALYTICS_LIMIT = 50
+
+# 집계 단위 선택지
+GRANULARITY_LABELS = {
+    "day": "일별",
+    "week": "주별",
+    "month": "월별",
+}
+
+# 이번 실행(rerun)의 쿼리/AI 호출 기록 시작
+run_stats = begin_instrumented_run()
+
+@st.cache_resource
+def get_question_repository() -> QuestionRepository:
+    """서버 프로세스 전체에서 공유되는 Repository 인스턴스를 반환합니다."""
+    return QuestionRepository(DB_PATH)
+
+# Repository 인스턴스 (연결 풀 공유)
+question_repository = get_question_repository()
+
+def main():
+    st.title("📈 학습 분석")
+    st.caption("답변을 저장할 때 한 번 분석해 둔 집계만 읽어 표시합니다.")
+    st.markdown("---")
+
+    try:
+        granularity = st.radio(
+            "집계 단위",
+            options=list(GRANULARITY_LABELS),
+            format_func=GRANULARITY_LABELS.get,
+            index=1,
+            horizontal=True,
+        )
+        periods = question_repository.get_period_analytics(granularity)
+
+        if not periods:
+            st.info("아직 분석할 답변이 없습니다. 문제 풀기 화면에서 답변을 저장해 보세요.")
+            return
+
+        # 전체 요약 (최근 기간과 직전 기간 비교)
+        latest = periods[-1]
+        previous = periods[-2] if len(periods) > 1 else None
+
+        def delta(key):
+            return f"{latest[key] - previous[key]:+.1f}" if previous else None
+
+        st.subheader(f"최근 기간 ({latest['period']})")
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("평균 단어 수", f"{latest['avg_words']:.1f}", delta("avg_words"))
+        col2.metric("평균 고유 단어 수", f"{latest['avg_unique_words']:.1f}", delta("avg_unique_words"))
+        col3.metric("평균 문장 길이", f"{latest['avg_sentence_length']:.1f}", delta("avg_sentence_length"))
+        # 군말은 줄어드는 것이 좋으므로 색상을 반대로 표시
+        col4.metric(
+            "100단어당 군말",
+            f"{latest['fillers_per_100_words']:.2f}",
+            delta("fillers_per_100_words"),
+            delta_color="inverse",
+        )
+        st.caption(f"답변 {latest['answer_count']}개 · 전체 기간 답변 {sum(p['answer_count'] for p in periods)}개")
+
+        st.markdown("---")
+
+        # 기간별 추이
+        st.subheader("📊 기간별 추이")
+        chart_data = {
+            "기간": [p["period"] for p in periods],
+            "평균 단어 수": [p["avg_words"] for p in periods],
+            "평균 고유 단어 수": [p["avg_unique_words"] for p in periods],
+        }
+        st.line_chart(chart_data, x="기간")
+
+        chart_col1, chart_col2 = st.columns(2)
+        with chart_col1:
+            st.caption("평균 문장 길이 (단어)")
+            st.line_chart(
+                {"기간": chart_data["기간"], "평균 문장 길이": [p["avg_sentence_length"] for p in periods]},
+                x="기간",
+            )
+        with chart_col2:
+            st.caption("100단어당 군말 (uhm, um, uh ...)")
+            st.line_chart(
+                {"기간": chart_data["기간"], "100단어당 군말": [p["fillers_per_100_words"] for p in periods]},
+                x="기간",
+            )
+
+        st.markdown("---")
+
+        # 질문별 분석
+        st.subheader("📝 질문별 분석")
+        questions = question_repository.get_question_analytics(QUESTION_ANALYTICS_LIMIT)
+        st.dataframe(
+            [
+                {
+                    "질문": q["question"],
+                    "답변 수": q["answer_count"],
+                    "평균 단어 수": round(q["avg_words"], 1),
+                    "평균 고유 단어 수": round(q["avg_unique_words"], 1),
+                    "평균 문장 길이": round(q["avg_sentence_length"], 1),
+                    "100단어당 군말": round(q["fillers_per_100_words"], 2),
+                }
+                for q in questions
+            ],
+            hide_index=True,
+            use_container_width=True,
+        )
+
+    except sqlite3.OperationalError:
+        st.error(f"데이터베이스 파일을 찾을 수 없습니다. 먼저 `python init_db.py`를 실행하여 데이터베이스를 초기화하세요.")
+    except Exception as e:
+        st.error(f"오류가 발생했습니다: {str(e)}")
+
+if __name__ == "__main__":
+    main()
+    render_debug_panel(run_stats)
@@ -0,0 +1,51 @@
+import functools
+import os
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# 프롬프트 템플릿 파일 디렉터리 ({name}_v{version}_system.md / {name}_v{version}_user.md)
+PROMPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts")
+
+# 조언 프롬프트 템플릿 버전 (템플릿 변경 시 새 버전 파일을 추가하고 올려서 기존 캐시를 무효화)
+ADVISE_PROMPT_VERSION = "2"
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """
+    고정된 시스템 메시지와 요청마다 바뀌는 사용자 메시지 템플릿의 쌍
+
+    시스템 메시지는 모든 요청에서 바이트 단위로 동일하게 앞에 오므로
+    제공자 측 프롬프트 캐싱(공통 접두어 재사용)의 대상이 됩니다.
+    """
+
+    name: str
+    version: str
+    system: str
+    user: str
+
+    def render(self, **values) -> List[Tuple[str, str]]:
+        """(역할, 내용) 메시지 목록을 반환합니다. 값은 사용자 메시지에만 채워집니다."""
+        return [("system", self.system), ("user", self.user.format(**values))]
+
+
+def _read_template(name: str, version: str, role: str) -> str:
+    path = os.path.join(PROMPTS_DIR, f"{name}_v{version}_{role}.md")
+    with open(path, encoding="utf-8") as f:
+        return f.read().strip()
+
+
+@functools.lru_cache(maxsize=None)
+def load_prompt(name: str, version: str) -> PromptTemplate:
+    """템플릿 파일을 프로세스당 한 번만 읽어 반환합니다."""
+    return PromptTemplate(
+        name=name,
+        version=version,
+        system=_read_template(name, version, "system"),
+        user=_read_template(name, version, "user"),
+    )
+
+
+def build_advise_messages(question: str, answer: str, version: str = ADVISE_PROMPT_VERSION) -> List[Tuple[str, str]]:
+    """오픽 질문과 학생 답변으로 조언 요청 메시지를 만듭니다."""
+    return load_prompt("advise", version).render(question=question.strip(), answer=answer.strip())
@@ -0,0 +1,85 @@
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# 캐시할 최대 항목 수 (초과 시 전체 비움)
+DEFAULT_MAX_ENTRIES = 256
+
+
+class VersionedCache:
+    """
+    쓰기 작업마다 올라가는 버전 번호로 무효화되는 프로세스 내 읽기 캐시 클래스
+
+    TTL 없이, 데이터를 바꾸는 작업이 invalidate()를 호출하거나
+    데이터베이스의 캐시 버전(cache_version 테이블)이 바뀐 것을 observe_version()으로 확인한 시점에 무효화됩니다.
+    캐시 버전은 질문/답변이 바뀔 때만 트리거로 올라가므로 다른 프로세스(CLI, 다른 서버)의 쓰기도 반영되고,
+    초안 저장 같은 관련 없는 쓰기로는 무효화되지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        캐시 초기화
+
+        Args:
+            max_entries: 캐시할 최대 항목 수
+        """
+        self.max_entries = max_entries
+        self.version = 0
+        self._entries: Dict[Hashable, Tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+        # 마지막으로 확인한 데이터베이스 캐시 버전
+        self._db_version: Optional[int] = None
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        현재 버전에서 캐시된 값을 반환하고, 없으면 loader로 읽어 저장합니다.
+
+        호출자가 결과를 수정해도 캐시에 영향이 없도록 깊은 복사본을 반환합니다.
+        """
+        with self._lock:
+            version = self.version
+            entry = self._entries.get(key)
+
+        if entry is not None and entry[0] == version:
+            value = entry[1]
+        else:
+            value = loader()
+            with self._lock:
+                # 읽는 동안 쓰기가 있었다면 오래된 값이므로 저장하지 않음
+                if self.version == version:
+                    if len(self._entries) >= self.max_entries:
+                        self._entries.clear()
+                    self._entries[key] = (version, value)
+
+        return copy.deepcopy(value)
+
+    def observe_version(self, db_version: int) -> None:
+        """
+        데이터베이스의 캐시 버전을 기록하고, 마지막으로 확인한 값과 다르면 캐시를 무효화합니다.
+
+        처음 확인할 때는 캐시가 비어 있으므로 기록만 합니다.
+        """
+        with self._lock:
+            previous, self._db_version = self._db_version, db_version
+        if previous is not None and previous != db_version:
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """버전을 올려 캐시된 모든 값을 무효화합니다."""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+
+_caches: Dict[str, VersionedCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(db_path: str) -> VersionedCache:
+    """데이터베이스 경로별로 프로세스 전체에서 공유되는 읽기 캐시를 반환합니다."""
+    with _caches_lock:
+        cache = _caches.get(db_path)
+        if cache is None:
+            cache = VersionedCache()
+            _caches[db_path] = cache
+        return cache
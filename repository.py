@@ -1,5 +1,122 @@
-import sqlite3
-from typing import List, Dict, Optional
+import functools
+import json
+import uuid
+from itertools import islice
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+
+from database import get_pool
+from migrations import (
+    get_cache_version,
+    migrate,
+    rebuild_answer_analytics,
+    rebuild_question_stats,
+    save_answer_features,
+    save_answer_signatures,
+)
+from read_cache import get_cache
+from scheduler import ReviewState, format_due_at, schedule_review
+from similarity import DUPLICATE_THRESHOLD, band_buckets, estimate_similarity, minhash_signature, unpack_signature
+
+# 질문 목록 정렬 기준별 SQL 정렬 식 (NULL은 가장 작은 값으로 취급)
+QUESTION_SORT_EXPRESSIONS = {
+    "id": "q.id",
+    "type": "COALESCE(q.type, '')",
+    "answers": "COALESCE(s.answer_count, 0)",
+    "difficulty": "COALESCE(CAST(s.difficulty_sum AS REAL) / NULLIF(s.answer_count, 0), -1)",
+}
+
+# 답변 분석 집계 단위별 기간 식 (week: 월요일 시작 날짜, month: YYYY-MM)
+ANALYTICS_PERIOD_EXPRESSIONS = {
+    "day": "period",
+    "week": "date(period, '-6 days', 'weekday 1')",
+    "month": "substr(period, 1, 7)",
+}
+
+# 마지막 사용 후 이 기간이 지난 연습 세션은 새 세션을 시작할 때 삭제
+PRACTICE_SESSION_RETENTION_DAYS = 30
+
+
+# 질문 통계 조회에서 공통으로 쓰는 SELECT 컬럼 (questions q LEFT JOIN question_stats s)
+_STATS_COLUMNS = """q.id, q.question, q.type, q.created_at,
+                       COALESCE(s.answer_count, 0) AS answers_count,
+                       CASE WHEN s.answer_count > 0
+                            THEN CAST(s.difficulty_sum AS REAL) / s.answer_count
+                       END AS avg_difficulty,
+                       s.last_answer_at AS last_answered_at"""
+
+
+def _stats_row(row) -> Dict:
+    """_STATS_COLUMNS로 조회한 질문 통계 행을 딕셔너리로 바꿉니다 (평균 난이도는 소수 둘째 자리까지)."""
+    return {
+        "id": row["id"],
+        "question": row["question"],
+        "type": row["type"],
+        "created_at": row["created_at"],
+        "answers_count": row["answers_count"],
+        "avg_difficulty": round(row["avg_difficulty"], 2) if row["avg_difficulty"] is not None else None,
+        "last_answered_at": row["last_answered_at"],
+    }
+
+
+def _analytics_row(row) -> Dict:
+    """답변 분석 집계 행(합계)을 평균 지표 딕셔너리로 바꿉니다."""
+    answer_count = row["answer_count"]
+    word_sum = row["word_sum"]
+    return {
+        "answer_count": answer_count,
+        "word_sum": word_sum,
+        "avg_words": word_sum / answer_count if answer_count else 0.0,
+        "avg_unique_words": row["unique_word_sum"] / answer_count if answer_count else 0.0,
+        "avg_sentence_length": word_sum / row["sentence_sum"] if row["sentence_sum"] else 0.0,
+        "fillers_per_100_words": row["filler_sum"] * 100 / word_sum if word_sum else 0.0,
+    }
+
+
+def _normalize_question(question: str) -> str:
+    """중복 질문 비교용 키 (공백을 하나로 합치고 대소문자를 무시)"""
+    return " ".join(question.split()).casefold()
+
+
+def _cached_read(method):
+    """
+    쓰기 작업으로 캐시 버전이 바뀌기 전까지 결과를 재사용하는 읽기 메서드 데코레이터
+
+    다른 프로세스의 질문/답변 쓰기도 반영하도록 읽기 전에 cache_version 테이블의 버전을 확인합니다.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.pool.connection() as conn:
+            self.read_cache.observe_version(get_cache_version(conn))
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        return self.read_cache.get_or_load(key, lambda: method(self, *args, **kwargs))
+    return wrapper
+
+
+def _invalidates_cache(method):
+    """실행 후 읽기 캐시 버전을 올리는 쓰기 메서드 데코레이터"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.read_cache.invalidate()
+    return wrapper
+
+
+def _batched(items: Iterable, batch_size: int) -> Iterator[List]:
+    """반복 가능한 객체를 batch_size 크기의 리스트로 나눠 차례로 반환합니다."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _to_fts_query(query: str) -> str:
+    """사용자 검색어를 FTS5 문법 오류가 나지 않는 접두어 검색식으로 변환합니다."""
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"*' for term in terms)
 
 
 class QuestionRepository:
@@ -13,35 +130,270 @@ class QuestionRepository:
             db_path: 데이터베이스 파일 경로
         """
         self.db_path = db_path
+        self.pool = get_pool(db_path)
+        
+        # 질문 목록/통계 읽기 캐시 (같은 DB를 쓰는 모든 인스턴스가 공유, 쓰기 메서드마다 무효화)
+        self.read_cache = get_cache(db_path)
+        
+        # 기존 데이터베이스를 최신 스키마로 갱신
+        with self.pool.connection() as conn:
+            migrate(conn)
     
+    @_cached_read
     def get_all_questions(self) -> List[Dict]:
         """데이터베이스에서 모든 질문을 가져옵니다."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT id, question FROM questions ORDER BY id")
-        questions = [{"id": row["id"], "question": row["question"]} for row in cursor.fetchall()]
+        with self.pool.connection() as conn:
+            cursor = conn.execute("SELECT id, question FROM questions ORDER BY id")
+            questions = [{"id": row["id"], "question": row["question"]} for row in cursor.fetchall()]
         
-        conn.close()
         return questions
     
+    @_cached_read
     def get_question_answer_count(self, question_id: int) -> int:
         """질문의 답변 개수를 반환합니다."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self.pool.connection() as conn:
+            cursor = conn.execute('''
+                SELECT COUNT(*) as count
+                FROM answers
+                WHERE question_id = ?
+            ''', (question_id,))
+            row = cursor.fetchone()
         
-        cursor.execute('''
-            SELECT COUNT(*) as count
-            FROM answers
-            WHERE question_id = ?
-        ''', (question_id,))
+        return row[0] if row else 0
+    
+    @_cached_read
+    def get_answer_counts(self) -> Dict[int, int]:
+        """
+        모든 질문의 답변 개수를 question_stats 테이블에서 한 번의 쿼리로 반환합니다.
+        
+        Returns:
+            {question_id: 답변 개수} 딕셔너리 (답변이 없는 질문은 0)
+        """
+        with self.pool.connection() as conn:
+            cursor = conn.execute('''
+                SELECT q.id, COALESCE(s.answer_count, 0)
+                FROM questions q
+                LEFT JOIN question_stats s ON s.question_id = q.id
+            ''')
+            counts = {row[0]: row[1] for row in cursor.fetchall()}
+        
+        return counts
+    
+    @_cached_read
+    def count_questions(self) -> int:
+        """전체 질문 수를 반환합니다."""
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT COUNT(*) FROM questions").fetchone()
+        
+        return row[0] if row else 0
+    
+    @_cached_read
+    def get_question_stats_page(
+        self,
+        sort_key: str = "id",
+        descending: bool = False,
+        after: Optional[Tuple] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Dict], Optional[Tuple]]:
+        """
+        질문 통계를 키셋(커서) 방식으로 한 페이지씩 가져옵니다.
+        
+        정렬은 SQL ORDER BY로 처리되며, 같은 정렬 값은 질문 ID로 순서를 고정합니다.
+        
+        Args:
+            sort_key: 정렬 기준 ("id", "type", "answers", "difficulty")
+            descending: 내림차순 여부
+            after: 이전 페이지가 반환한 다음 페이지 커서 (None이면 첫 페이지)
+            limit: 페이지 크기
+        
+        Returns:
+            (질문 통계 딕셔너리 리스트, 다음 페이지 커서 또는 None)
+        """
+        if sort_key not in QUESTION_SORT_EXPRESSIONS:
+            raise ValueError(f"지원하지 않는 정렬 기준입니다: {sort_key}")
+        
+        sort_expr = QUESTION_SORT_EXPRESSIONS[sort_key]
+        direction = "DESC" if descending else "ASC"
+        comparison = "<" if descending else ">"
+        
+        params: list = []
+        where = ""
+        if after is not None:
+            where = f"WHERE ({sort_expr}, q.id) {comparison} (?, ?)"
+            params.extend(after)
+        # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+        params.append(limit + 1)
+        
+        with self.pool.connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT {_STATS_COLUMNS},
+                       {sort_expr} AS sort_value
+                FROM questions q
+                LEFT JOIN question_stats s ON s.question_id = q.id
+                {where}
+                ORDER BY {sort_expr} {direction}, q.id {direction}
+                LIMIT ?
+            ''', params)
+            rows = cursor.fetchall()
+        
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        stats = [_stats_row(row) for row in rows]
+        next_cursor = (rows[-1]["sort_value"], rows[-1]["id"]) if has_next else None
+        
+        return stats, next_cursor
+    
+    @_cached_read
+    def get_question(self, question_id: int) -> Optional[Dict]:
+        """
+        질문 하나를 ID로 가져옵니다.
+        
+        Args:
+            question_id: 질문 ID
+        
+        Returns:
+            id, question, type, created_at 딕셔너리 (없으면 None)
+        """
+        with self.pool.connection() as conn:
+            row = conn.execute('''
+                SELECT id, question, type, created_at
+                FROM questions
+                WHERE id = ?
+            ''', (question_id,)).fetchone()
+        
+        if row is None:
+            return None
+        
+        return {
+            "id": row["id"],
+            "question": row["question"],
+            "type": row["type"],
+            "created_at": row["created_at"],
+        }
+    
+    @_cached_read
+    def get_question_stats_by_id(self, question_id: int) -> Optional[Dict]:
+        """
+        질문 하나의 정보와 통계를 question_stats 테이블에서 가져옵니다.
+        
+        Args:
+            question_id: 질문 ID
+        
+        Returns:
+            _stats_row 형식의 딕셔너리 (질문이 없으면 None)
+        """
+        with self.pool.connection() as conn:
+            row = conn.execute(f'''
+                SELECT {_STATS_COLUMNS}
+                FROM questions q
+                LEFT JOIN question_stats s ON s.question_id = q.id
+                WHERE q.id = ?
+            ''', (question_id,)).fetchone()
+        
+        if row is None:
+            return None
+        
+        return _stats_row(row)
+    
+    def get_answer_summaries_page(
+        self,
+        question_id: int,
+        after: Optional[Tuple] = None,
+        limit: int = 20,
+        preview_length: int = 120,
+    ) -> Tuple[List[Dict], Optional[Tuple]]:
+        """
+        질문의 답변 메타데이터(본문 제외)를 최신순으로 한 페이지씩 가져옵니다.
+        
+        Args:
+            question_id: 질문 ID
+            after: 이전 페이지가 반환한 다음 페이지 커서 (None이면 첫 페이지)
+            limit: 페이지 크기
+            preview_length: 미리보기 글자 수
+        
+        Returns:
+            (id, difficulty, created_at, length, preview, has_advice 딕셔너리 리스트,
+             다음 페이지 커서 또는 None)
+        """
+        params: list = [preview_length, question_id]
+        where = "WHERE question_id = ?"
+        if after is not None:
+            where += " AND (created_at, id) < (?, ?)"
+            params.extend(after)
+        # 다음 페이지 존재 여부 확인을 위해 한 행 더 조회
+        params.append(limit + 1)
+        
+        with self.pool.connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT id, difficulty, created_at,
+                       LENGTH(answer) AS length,
+                       SUBSTR(answer, 1, ?) AS preview,
+                       advice IS NOT NULL AS has_advice
+                FROM answers
+                {where}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
+            ''', params)
+            rows = cursor.fetchall()
+        
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        summaries = [
+            {
+                "id": row["id"],
+                "difficulty": row["difficulty"],
+                "created_at": row["created_at"],
+                "length": row["length"],
+                "preview": row["preview"],
+                "has_advice": bool(row["has_advice"]),
+            }
+            for row in rows
+        ]
+        next_cursor = (rows[-1]["created_at"], rows[-1]["id"]) if has_next else None
+        
+        return summaries, next_cursor
+    
+    def get_answer(self, answer_id: int) -> Optional[Dict]:
+        """
+        답변 하나의 전체 내용을 가져옵니다.
+        
+        Args:
+            answer_id: 답변 ID
         
-        row = cursor.fetchone()
-        conn.close()
+        Returns:
+            id, question_id, answer, difficulty, created_at, advice 딕셔너리 (없으면 None)
+        """
+        with self.pool.connection() as conn:
+            row = conn.execute('''
+                SELECT id, question_id, answer, difficulty, created_at, advice
+                FROM answers
+                WHERE id = ?
+            ''', (answer_id,)).fetchone()
+        
+        if row is None:
+            return None
+        
+        return {
+            "id": row["id"],
+            "question_id": row["question_id"],
+            "answer": row["answer"],
+            "difficulty": row["difficulty"],
+            "created_at": row["created_at"],
+            "advice": row["advice"],
+        }
+    
+    def count_answers_without_advice(self, question_id: int) -> int:
+        """질문의 답변 중 AI 조언이 없는 답변 수를 반환합니다."""
+        with self.pool.connection() as conn:
+            row = conn.execute('''
+                SELECT COUNT(*)
+                FROM answers
+                WHERE question_id = ? AND advice IS NULL
+            ''', (question_id,)).fetchone()
         
         return row[0] if row else 0
     
+    @_invalidates_cache
     def save_answer(self, question_id: int, answer: str, difficulty: int) -> bool:
         """
         답변을 데이터베이스에 저장합니다.
@@ -60,14 +412,906 @@ class QuestionRepository:
         if difficulty < 1 or difficulty > 5:
             return False
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self.pool.connection() as conn:
+            cursor = conn.execute('''
+                INSERT INTO answers (question_id, answer, difficulty)
+                VALUES (?, ?, ?)
+            ''', (question_id, answer, difficulty))
+            
+            # 답변 분석 결과와 유사도 색인 저장 (분석 집계는 트리거가 갱신)
+            self._index_answers(conn, [(cursor.lastrowid, answer)])
+            
+            # 선택한 난이도로 다음 복습 일정 갱신 (같은 트랜잭션)
+            self._update_schedule(conn, question_id, difficulty)
+        
+        return True
+    
+    @_invalidates_cache
+    def add_question(self, question: str, question_type: Optional[str] = None) -> bool:
+        """
+        새 질문을 데이터베이스에 추가합니다.
+        
+        Args:
+            question: 질문 내용
+            question_type: 질문 유형
+        
+        Returns:
+            추가 성공 여부
+        """
+        if not question.strip():
+            return False
+        
+        with self.pool.connection() as conn:
+            conn.execute(
+                "INSERT INTO questions (question, type) VALUES (?, ?)",
+                (question, question_type),
+            )
+        
+        return True
+    
+    @_invalidates_cache
+    def add_questions_bulk(self, questions: Iterable[Tuple[str, Optional[str]]]) -> int:
+        """
+        여러 질문을 하나의 트랜잭션에서 executemany로 추가합니다.
+        
+        Args:
+            questions: (질문 내용, 질문 유형) 튜플 목록 (빈 질문은 건너뜀)
+        
+        Returns:
+            추가된 질문 수
+        """
+        rows = [
+            (question.strip(), question_type)
+            for question, question_type in questions
+            if question.strip()
+        ]
+        if not rows:
+            return 0
         
-        cursor.execute('''
-            INSERT INTO answers (question_id, answer, difficulty) 
-            VALUES (?, ?, ?)
-        ''', (question_id, answer, difficulty))
+        with self.pool.connection() as conn:
+            conn.executemany("INSERT INTO questions (question, type) VALUES (?, ?)", rows)
+        
+        return len(rows)
+    
+    @_invalidates_cache
+    def import_questions(
+        self,
+        questions: Iterable[Tuple[str, Optional[str]]],
+        batch_size: int = 1000,
+    ) -> Dict[str, int]:
+        """
+        대량의 질문을 스트리밍으로 가져옵니다.
+        
+        입력은 batch_size 단위로 나눠 executemany로 저장하며, 전체가 하나의 트랜잭션입니다.
+        공백과 대소문자를 무시하고 비교해 이미 있는 질문(같은 입력 안의 중복 포함)은 건너뜁니다.
+        저장된 질문도 같은 방식으로 비교하도록 기존 질문 내용을 먼저 한 번 읽어 둡니다.
+        
+        Args:
+            questions: (질문 내용, 질문 유형) 튜플을 생성하는 반복 가능한 객체
+            batch_size: 한 번의 executemany로 저장할 행 수
+        
+        Returns:
+            inserted, duplicates, skipped(빈 질문) 개수 딕셔너리
+        """
+        result = {"inserted": 0, "duplicates": 0, "skipped": 0}
+        
+        with self.pool.connection() as conn:
+            existing = {_normalize_question(row["question"]) for row in conn.execute("SELECT question FROM questions")}
+            
+            for batch in _batched(questions, batch_size):
+                rows = []
+                for question, question_type in batch:
+                    question = " ".join(question.split())
+                    if not question:
+                        result["skipped"] += 1
+                        continue
+                    key = _normalize_question(question)
+                    if key in existing:
+                        result["duplicates"] += 1
+                        continue
+                    existing.add(key)
+                    rows.append((question, question_type or None))
+                
+                if rows:
+                    conn.executemany("INSERT INTO questions (question, type) VALUES (?, ?)", rows)
+                    result["inserted"] += len(rows)
+        
+        return result
+    
+    def iter_questions(self) -> Iterator[Dict]:
+        """모든 질문을 한 행씩 스트리밍으로 반환합니다 (내보내기용)."""
+        with self.pool.connection() as conn:
+            cursor = conn.execute("SELECT id, question, type, created_at FROM questions ORDER BY id")
+            for row in cursor:
+                yield {
+                    "id": row["id"],
+                    "question": row["question"],
+                    "type": row["type"],
+                    "created_at": row["created_at"],
+                }
+    
+    def iter_answer_history(self) -> Iterator[Dict]:
+        """모든 답변을 질문 정보와 함께 한 행씩 스트리밍으로 반환합니다 (내보내기용)."""
+        with self.pool.connection() as conn:
+            cursor = conn.execute('''
+                SELECT a.id, a.question_id, q.question, q.type,
+                       a.answer, a.difficulty, a.created_at, a.advice
+                FROM answers a
+                JOIN questions q ON q.id = a.question_id
+                ORDER BY a.id
+            ''')
+            for row in cursor:
+                yield {
+                    "answer_id": row["id"],
+                    "question_id": row["question_id"],
+                    "question": row["question"],
+                    "type": row["type"],
+                    "answer": row["answer"],
+                    "difficulty": row["difficulty"],
+                    "created_at": row["created_at"],
+                    "advice": row["advice"],
+                }
+    
+    @_invalidates_cache
+    def delete_question(self, question_id: int) -> bool:
+        """질문을 삭제합니다 (CASCADE로 관련 답변도 삭제됨)."""
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM questions WHERE id = ?", (question_id,))
         
-        conn.commit()
-        conn.close()
         return True
+    
+    @_invalidates_cache
+    def add_answer(self, question_id: int, answer: str, difficulty: int) -> bool:
+        """
+        복습 일정을 바꾸지 않고 새 답변을 추가합니다 (질문 관리 화면용).
+        
+        Args:
+            question_id: 질문 ID
+            answer: 답변 내용
+            difficulty: 난이도 (1-5)
+        
+        Returns:
+            추가 성공 여부
+        """
+        if not answer.strip():
+            return False
+        
+        if difficulty < 1 or difficulty > 5:
+            return False
+        
+        with self.pool.connection() as conn:
+            cursor = conn.execute('''
+                INSERT INTO answers (question_id, answer, difficulty)
+                VALUES (?, ?, ?)
+            ''', (question_id, answer, difficulty))
+            self._index_answers(conn, [(cursor.lastrowid, answer)])
+        
+        return True
+    
+    @_invalidates_cache
+    def update_answer(self, answer_id: int, answer: str, difficulty: int) -> bool:
+        """
+        답변을 수정합니다. 본문이 바뀌면 저장된 AI 조언은 삭제됩니다.
+        
+        Args:
+            answer_id: 답변 ID
+            answer: 답변 내용
+            difficulty: 난이도 (1-5)
+        
+        Returns:
+            수정 성공 여부
+        """
+        if not answer.strip():
+            return False
+        
+        if difficulty < 1 or difficulty > 5:
+            return False
+        
+        with self.pool.connection() as conn:
+            conn.execute('''
+                UPDATE answers
+                SET answer = ?1, difficulty = ?2,
+                    -- 본문이 바뀌면 이전 본문에 대한 조언은 지움
+                    advice = CASE WHEN answer = ?1 THEN advice END,
+                    advice_at = CASE WHEN answer = ?1 THEN advice_at END
+                WHERE id = ?3
+            ''', (answer, difficulty, answer_id))
+            self._index_answers(conn, [(answer_id, answer)])
+        
+        return True
+    
+    @_invalidates_cache
+    def delete_answer(self, answer_id: int) -> bool:
+        """답변을 삭제합니다."""
+        with self.pool.connection() as conn:
+            conn.execute("DELETE FROM answers WHERE id = ?", (answer_id,))
+        
+        return True
+    
+    @_invalidates_cache
+    def update_answers_bulk(self, updates: Iterable[Tuple[int, str, int]]) -> int:
+        """
+        여러 답변을 하나의 트랜잭션에서 executemany로 수정합니다.
+        
+        Args:
+            updates: (답변 ID, 답변 내용, 난이도) 튜플 목록 (유효하지 않은 항목은 건너뛰고, 같은 ID는 마지막 값 사용)
+        
+        Returns:
+            실제로 수정된 답변 수
+        """
+        # 같은 답변 ID가 여러 번 있으면 마지막 값으로 한 번만 수정
+        latest = {
+            answer_id: (answer, difficulty)
+            for answer_id, answer, difficulty in updates
+            if answer.strip() and 1 <= difficulty <= 5
+        }
+        rows = [(answer, difficulty, answer_id) for answer_id, (answer, difficulty) in latest.items()]
+        if not rows:
+            return 0
+        
+        with self.pool.connection() as conn:
+            cursor = conn.executemany('''
+                UPDATE answers
+                SET answer = ?1, difficulty = ?2,
+                    -- 본문이 바뀌면 이전 본문에 대한 조언은 지움
+                    advice = CASE WHEN answer = ?1 THEN advice END,
+                    advice_at = CASE WHEN answer = ?1 THEN advice_at END
+                WHERE id = ?3
+            ''', rows)
+            self._index_answers(conn, [(answer_id, answer) for answer, _, answer_id in rows])
+        
+        return cursor.rowcount
+    
+    @_invalidates_cache
+    def delete_answers_bulk(self, answer_ids: Iterable[int]) -> int:
+        """
+        여러 답변을 하나의 트랜잭션에서 executemany로 삭제합니다.
+        
+        Args:
+            answer_ids: 삭제할 답변 ID 목록
+        
+        Returns:
+            실제로 삭제된 답변 수 (이미 없는 답변은 세지 않음)
+        """
+        rows = [(answer_id,) for answer_id in answer_ids]
+        if not rows:
+            return 0
+        
+        with self.pool.connection() as conn:
+            cursor = conn.executemany("DELETE FROM answers WHERE id = ?", rows)
+        
+        return cursor.rowcount
+    
+    def _index_answers(self, conn, answers: List[Tuple[int, str]]) -> None:
+        """새로 쓴 답변의 분석 결과와 MinHash/LSH 유사도 색인을 같은 트랜잭션에서 저장합니다."""
+        save_answer_features(conn, answers)
+        save_answer_signatures(conn, answers)
+    
+    def _update_schedule(self, conn, question_id: int, difficulty: int) -> None:
+        """SM-2 알고리즘으로 질문의 다음 복습 시각을 계산해 저장합니다."""
+        row = conn.execute('''
+            SELECT ease, interval_days, repetitions
+            FROM question_schedule
+            WHERE question_id = ?
+        ''', (question_id,)).fetchone()
+        state = ReviewState(row["ease"], row["interval_days"], row["repetitions"]) if row else ReviewState()
+        
+        next_state = schedule_review(state, difficulty)
+        conn.execute('''
+            INSERT INTO question_schedule (
+                question_id, due_at, ease, interval_days, repetitions, last_reviewed_at
+            )
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT (question_id) DO UPDATE SET
+                due_at = excluded.due_at,
+                ease = excluded.ease,
+                interval_days = excluded.interval_days,
+                repetitions = excluded.repetitions,
+                last_reviewed_at = excluded.last_reviewed_at
+        ''', (
+            question_id,
+            format_due_at(next_state.interval_days),
+            next_state.ease,
+            next_state.interval_days,
+            next_state.repetitions,
+        ))
+    
+    def get_due_questions(self, limit: int) -> List[Dict]:
+        """
+        복습할 때가 된 질문(복습 예정 시각이 지났거나 아직 답변한 적 없는 질문)을
+        예정 시각이 가장 이른 질문부터 limit개 가져옵니다.
+        
+        아직 때가 되지 않은 질문은 포함하지 않으므로, 모두 복습했으면 빈 목록을 반환합니다.
+        
+        Args:
+            limit: 가져올 질문 수
+        
+        Returns:
+            id, question, due_at 딕셔너리 리스트 (복습 예정 시각 순)
+        """
+        with self.pool.connection() as conn:
+            cursor = conn.execute('''
+                SELECT q.id, q.question, s.due_at
+                FROM question_schedule s
+                JOIN questions q ON q.id = s.question_id
+                WHERE s.due_at <= CURRENT_TIMESTAMP OR s.last_reviewed_at IS NULL
+                ORDER BY s.due_at, s.question_id
+                LIMIT ?
+            ''', (limit,))
+            questions = [
+                {"id": row["id"], "question": row["question"], "due_at": row["due_at"]}
+                for row in cursor.fetchall()
+            ]
+        
+        return questions
+    
+    def get_next_due_at(self) -> Optional[str]:
+        """
+        가장 이른 복습 예정 시각을 가져옵니다.
+        
+        Returns:
+            복습 예정 시각 (UTC, 질문이 없으면 None)
+        """
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT MIN(due_at) AS due_at FROM question_schedule").fetchone()
+        
+        return row["due_at"]
+    
+    def start_practice_session(
+        self,
+        question_ids: List[int],
+        shuffle: bool,
+        session_id: Optional[str] = None,
+    ) -> str:
+        """
+        연습 세션의 질문 순서를 저장하고 진행 위치를 처음으로 돌립니다.
+        
+        질문 내용은 저장하지 않고 ID 목록만 저장하므로, 질문 내용은 get_question으로 필요할 때 가져옵니다.
+        
+        Args:
+            question_ids: 풀 순서대로 정렬된 질문 ID 목록
+            shuffle: 질문 순서를 섞었는지 여부
+            session_id: 교체할 기존 세션 ID (None이면 새 세션 생성)
+        
+        Returns:
+            세션 ID
+        """
+        session_id = session_id or uuid.uuid4().hex
+        
+        with self.pool.connection() as conn:
+            conn.execute('''
+                INSERT INTO practice_sessions (id, question_ids, cursor, shuffle)
+                VALUES (?, ?, 0, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    question_ids = excluded.question_ids,
+                    cursor = 0,
+                    shuffle = excluded.shuffle,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', (session_id, json.dumps(question_ids, separators=(",", ":")), int(shuffle)))
+            
+            # 오래 사용하지 않은 세션 정리
+            conn.execute('''
+                DELETE FROM practice_sessions
+                WHERE updated_at < datetime('now', ?)
+            ''', (f"-{PRACTICE_SESSION_RETENTION_DAYS} days",))
+        
+        return session_id
+    
+    def get_practice_session(self, session_id: str) -> Optional[Dict]:
+        """
+        연습 세션을 가져옵니다.
+        
+        Args:
+            session_id: 세션 ID
+        
+        Returns:
+            id, question_ids, cursor, shuffle 딕셔너리 (없으면 None)
+        """
+        with self.pool.connection() as conn:
+            row = conn.execute('''
+                SELECT id, question_ids, cursor, shuffle
+                FROM practice_sessions
+                WHERE id = ?
+            ''', (session_id,)).fetchone()
+        
+        if row is None:
+            return None
+        
+        return {
+            "id": row["id"],
+            "question_ids": json.loads(row["question_ids"]),
+            "cursor": row["cursor"],
+            "shuffle": bool(row["shuffle"]),
+        }
+    
+    def set_practice_session_cursor(self, session_id: str, position: int) -> bool:
+        """
+        연습 세션의 진행 위치를 저장합니다.
+        
+        Args:
+            session_id: 세션 ID
+            position: 다음에 풀 질문의 위치 (0부터 시작)
+        
+        Returns:
+            저장 성공 여부
+        """
+        with self.pool.connection() as conn:
+            cursor = conn.execute('''
+                UPDATE practice_sessions
+                SET cursor = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (position, session_id))
+        
+        return cursor.rowcount > 0
+    
+    def get_draft(self, session_id: str, question_id: int) -> Optional[Dict]:
+        """
+        연습 세션에서 작성 중이던 답변 초안을 가져옵니다.
+        
+        Args:
+            session_id: 세션 ID
+            question_id: 질문 ID
+        
+        Returns:
+            answer, difficulty, updated_at 딕셔너리 (없으면 None)
+        """
+        with self.pool.connection() as conn:
+            row = conn.execute('''
+                SELECT answer, difficulty, updated_at
+                FROM drafts
+                WHERE session_id = ? AND question_id = ?
+            ''', (session_id, question_id)).fetchone()
+        
+        if row is None:
+            return None
+        
+        return {
+            "answer": row["answer"],
+            "difficulty": row["difficulty"],
+            "updated_at": row["updated_at"],
+        }
+    
+    def save_drafts(
+        self,
+        upserts: Iterable[Tuple[str, int, str, int]],
+        deletes: Iterable[Tuple[str, int]] = (),
+    ) -> None:
+        """
+        답변 초안을 하나의 트랜잭션에서 일괄 저장/삭제합니다.
+        
+        세션이나 질문이 이미 삭제된 초안은 건너뜁니다.
+        
+        Args:
+            upserts: (세션 ID, 질문 ID, 답변 내용, 난이도) 튜플 목록
+            deletes: 삭제할 (세션 ID, 질문 ID) 튜플 목록
+        """
+        with self.pool.connection() as conn:
+            conn.executemany('''
+                INSERT INTO drafts (session_id, question_id, answer, difficulty)
+                SELECT ?1, ?2, ?3, ?4
+                WHERE EXISTS (SELECT 1 FROM practice_sessions WHERE id = ?1)
+                  AND EXISTS (SELECT 1 FROM questions WHERE id = ?2)
+                ON CONFLICT(session_id, question_id) DO UPDATE SET
+                    answer = excluded.answer,
+                    difficulty = excluded.difficulty,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', list(upserts))
+            conn.executemany(
+                "DELETE FROM drafts WHERE session_id = ? AND question_id = ?",
+                list(deletes),
+            )
+    
+    def get_answers_for_advice(self, question_id: Optional[int] = None, only_missing: bool = True) -> List[Dict]:
+        """
+        AI 조언을 생성할 답변 목록을 질문 내용과 함께 가져옵니다.
+        
+        Args:
+            question_id: 질문 ID (None이면 모든 질문)
+            only_missing: True이면 아직 조언이 없는 답변만 반환
+        
+        Returns:
+            answer_id, question_id, question, answer 딕셔너리 리스트
+        """
+        conditions = []
+        params = []
+        if question_id is not None:
+            conditions.append("a.question_id = ?")
+            params.append(question_id)
+        if only_missing:
+            conditions.append("a.advice IS NULL")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        with self.pool.connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT a.id, a.question_id, q.question, a.answer
+                FROM answers a
+                JOIN questions q ON q.id = a.question_id
+                {where}
+                ORDER BY a.id
+            ''', params)
+            answers = [
+                {
+                    "answer_id": row["id"],
+                    "question_id": row["question_id"],
+                    "question": row["question"],
+                    "answer": row["answer"],
+                }
+                for row in cursor.fetchall()
+            ]
+        
+        return answers
+    
+    def save_answer_advice(self, answer_id: int, advice: str) -> bool:
+        """
+        답변에 대한 AI 조언을 저장합니다.
+        
+        Args:
+            answer_id: 답변 ID
+            advice: AI 조언 내용
+        
+        Returns:
+            저장 성공 여부
+        """
+        if not advice.strip():
+            return False
+        
+        with self.pool.connection() as conn:
+            cursor = conn.execute('''
+                UPDATE answers
+                SET advice = ?, advice_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (advice, answer_id))
+        
+        return cursor.rowcount > 0
+    
+    def search(self, query: str, limit: int = 20) -> Dict[str, List[Dict]]:
+        """
+        질문과 답변 본문을 FTS5 전문 검색으로 찾습니다.
+        
+        검색어의 각 단어는 접두어 일치로 검색되며, 모든 단어를 포함한 결과만 반환합니다.
+        bm25 점수는 FTS 테이블마다 기준이 달라 서로 비교할 수 없으므로 질문/답변 결과를 따로 정렬합니다.
+        
+        Args:
+            query: 검색어
+            limit: 질문/답변 각각의 최대 결과 수
+        
+        Returns:
+            {"questions": [...], "answers": [...]} 딕셔너리
+            (각 항목은 question_id, answer_id, question, snippet, rank 딕셔너리,
+             각 목록 안에서 bm25 관련도 순, 일치 부분은 **로 강조)
+        """
+        results = {"questions": [], "answers": []}
+        match = _to_fts_query(query)
+        if not match:
+            return results
+        
+        with self.pool.connection() as conn:
+            question_rows = conn.execute('''
+                SELECT q.id AS question_id, NULL AS answer_id,
+                       q.question AS question,
+                       snippet(questions_fts, 0, '**', '**', '…', 16) AS snippet,
+                       bm25(questions_fts) AS rank
+                FROM questions_fts
+                JOIN questions q ON q.id = questions_fts.rowid
+                WHERE questions_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            ''', (match, limit)).fetchall()
+            answer_rows = conn.execute('''
+                SELECT a.question_id, a.id AS answer_id,
+                       q.question AS question,
+                       snippet(answers_fts, 0, '**', '**', '…', 16) AS snippet,
+                       bm25(answers_fts) AS rank
+                FROM answers_fts
+                JOIN answers a ON a.id = answers_fts.rowid
+                JOIN questions q ON q.id = a.question_id
+                WHERE answers_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            ''', (match, limit)).fetchall()
+        
+        for kind, rows in (("questions", question_rows), ("answers", answer_rows)):
+            results[kind] = [
+                {
+                    "question_id": row["question_id"],
+                    "answer_id": row["answer_id"],
+                    "question": row["question"],
+                    "snippet": row["snippet"],
+                    "rank": row["rank"],
+                }
+                for row in rows
+            ]
+        
+        return results
+    
+    @_cached_read
+    def get_period_analytics(self, granularity: str = "day") -> List[Dict]:
+        """
+        기간별 답변 분석 지표를 오래된 기간부터 가져옵니다 (집계 테이블만 읽음).
+        
+        Args:
+            granularity: 집계 단위 (ANALYTICS_PERIOD_EXPRESSIONS의 키: day, week, month)
+        
+        Returns:
+            period, answer_count, word_sum, avg_words, avg_unique_words,
+            avg_sentence_length, fillers_per_100_words 딕셔너리 리스트
+        """
+        if granularity not in ANALYTICS_PERIOD_EXPRESSIONS:
+            raise ValueError(f"지원하지 않는 집계 단위입니다: {granularity}")
+        period_expression = ANALYTICS_PERIOD_EXPRESSIONS[granularity]
+        
+        with self.pool.connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT {period_expression} AS period,
+                       SUM(answer_count) AS answer_count,
+                       SUM(word_sum) AS word_sum,
+                       SUM(unique_word_sum) AS unique_word_sum,
+                       SUM(sentence_sum) AS sentence_sum,
+                       SUM(filler_sum) AS filler_sum
+                FROM period_analytics
+                WHERE answer_count > 0
+                GROUP BY 1
+                ORDER BY 1
+            ''')
+            periods = [{"period": row["period"], **_analytics_row(row)} for row in cursor.fetchall()]
+        
+        return periods
+    
+    @_cached_read
+    def get_question_analytics(self, limit: int = 50) -> List[Dict]:
+        """
+        답변이 많은 질문부터 질문별 답변 분석 지표를 가져옵니다 (집계 테이블만 읽음).
+        
+        Args:
+            limit: 가져올 질문 수
+        
+        Returns:
+            question_id, question, answer_count, word_sum, avg_words, avg_unique_words,
+            avg_sentence_length, fillers_per_100_words 딕셔너리 리스트
+        """
+        with self.pool.connection() as conn:
+            cursor = conn.execute('''
+                SELECT qa.question_id, q.question, qa.answer_count, qa.word_sum,
+                       qa.unique_word_sum, qa.sentence_sum, qa.filler_sum
+                FROM question_analytics qa
+                JOIN questions q ON q.id = qa.question_id
+                WHERE qa.answer_count > 0
+                ORDER BY qa.answer_count DESC, qa.question_id
+                LIMIT ?
+            ''', (limit,))
+            questions = [
+                {"question_id": row["question_id"], "question": row["question"], **_analytics_row(row)}
+                for row in cursor.fetchall()
+            ]
+        
+        return questions
+    
+    def find_similar_answers(
+        self,
+        question_id: int,
+        answer: str,
+        threshold: float = DUPLICATE_THRESHOLD,
+        exclude_answer_id: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        같은 질문의 기존 답변 중 거의 같은 답변을 LSH 버킷으로 찾습니다.
+        
+        전체 답변과 비교하지 않고 같은 버킷에 들어간 후보만 MinHash 서명으로 확인합니다.
+        
+        Args:
+            question_id: 질문 ID
+            answer: 비교할 답변 내용
+            threshold: 거의 같은 답변으로 볼 최소 추정 유사도 (0~1)
+            exclude_answer_id: 제외할 답변 ID (수정 중인 답변 자신)
+        
+        Returns:
+            answer_id, answer, created_at, similarity 딕셔너리 리스트 (유사도 높은 순)
+        """
+        signature = minhash_signature(answer)
+        if signature is None:
+            return []
+        buckets = list(enumerate(band_buckets(signature)))
+        placeholders = ", ".join("(?, ?)" for _ in buckets)
+        
+        with self.pool.connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT m.answer_id, m.signature, a.answer, a.created_at
+                FROM answer_minhash m
+                JOIN answers a ON a.id = m.answer_id
+                WHERE m.answer_id IN (
+                    SELECT answer_id
+                    FROM answer_lsh_buckets
+                    WHERE question_id = ? AND (band, bucket) IN (VALUES {placeholders})
+                )
+            ''', [question_id] + [value for pair in buckets for value in pair])
+            rows = cursor.fetchall()
+        
+        similar = []
+        for row in rows:
+            if row["answer_id"] == exclude_answer_id:
+                continue
+            similarity = estimate_similarity(signature, unpack_signature(row["signature"]))
+            if similarity >= threshold:
+                similar.append({
+                    "answer_id": row["answer_id"],
+                    "answer": row["answer"],
+                    "created_at": row["created_at"],
+                    "similarity": similarity,
+                })
+        
+        similar.sort(key=lambda item: item["similarity"], reverse=True)
+        return similar
+    
+    def find_duplicate_groups(
+        self,
+        question_id: Optional[int] = None,
+        threshold: float = DUPLICATE_THRESHOLD,
+        preview_length: int = 100,
+    ) -> List[Dict]:
+        """
+        질문별로 거의 같은 답변끼리 묶은 그룹을 찾습니다.
+        
+        같은 LSH 버킷을 공유하는 답변 쌍만 서명으로 확인하고 (모든 쌍을 비교하지 않음),
+        유사한 쌍을 연결해 그룹으로 합칩니다.
+        
+        Args:
+            question_id: 질문 ID (None이면 모든 질문)
+            threshold: 거의 같은 답변으로 볼 최소 추정 유사도 (0~1)
+            preview_length: 답변 미리보기 최대 글자 수
+        
+        Returns:
+            question_id, question, answers 딕셔너리 리스트
+            (answers: id, preview, difficulty, created_at, has_advice 딕셔너리 리스트, 오래된 순)
+        """
+        where = "WHERE question_id = ?" if question_id is not None else ""
+        params = [question_id] if question_id is not None else []
+        
+        with self.pool.connection() as conn:
+            cursor = conn.execute(f'''
+                SELECT group_concat(answer_id) AS answer_ids
+                FROM answer_lsh_buckets
+                {where}
+                GROUP BY question_id, band, bucket
+                HAVING COUNT(*) > 1
+            ''', params)
+            candidate_buckets = [
+                [int(answer_id) for answer_id in row["answer_ids"].split(",")]
+                for row in cursor.fetchall()
+            ]
+            
+            candidate_ids = sorted({answer_id for bucket in candidate_buckets for answer_id in bucket})
+            signatures = {}
+            for batch in _batched(candidate_ids, 500):
+                cursor = conn.execute(f'''
+                    SELECT answer_id, signature
+                    FROM answer_minhash
+                    WHERE answer_id IN ({", ".join("?" * len(batch))})
+                ''', batch)
+                for row in cursor.fetchall():
+                    signatures[row["answer_id"]] = unpack_signature(row["signature"])
+        
+        # 유사한 쌍을 union-find로 묶음 (이미 같은 그룹이면 비교 생략)
+        parent = {answer_id: answer_id for answer_id in signatures}
+        
+        def find(answer_id):
+            while parent[answer_id] != answer_id:
+                parent[answer_id] = parent[parent[answer_id]]
+                answer_id = parent[answer_id]
+            return answer_id
+        
+        for bucket in candidate_buckets:
+            for i, first in enumerate(bucket):
+                for second in bucket[i + 1:]:
+                    root_first, root_second = find(first), find(second)
+                    if root_first == root_second:
+                        continue
+                    if estimate_similarity(signatures[first], signatures[second]) >= threshold:
+                        parent[root_second] = root_first
+        
+        members: Dict[int, List[int]] = {}
+        for answer_id in signatures:
+            members.setdefault(find(answer_id), []).append(answer_id)
+        grouped_ids = [answer_ids for answer_ids in members.values() if len(answer_ids) > 1]
+        if not grouped_ids:
+            return []
+        
+        answers = {}
+        with self.pool.connection() as conn:
+            for batch in _batched([answer_id for ids in grouped_ids for answer_id in ids], 500):
+                cursor = conn.execute(f'''
+                    SELECT a.id, a.question_id, q.question, substr(a.answer, 1, ?) AS preview,
+                           a.difficulty, a.created_at, a.advice IS NOT NULL AS has_advice
+                    FROM answers a
+                    JOIN questions q ON q.id = a.question_id
+                    WHERE a.id IN ({", ".join("?" * len(batch))})
+                ''', [preview_length] + batch)
+                for row in cursor.fetchall():
+                    answers[row["id"]] = row
+        
+        groups = []
+        for answer_ids in grouped_ids:
+            rows = sorted(
+                (answers[answer_id] for answer_id in answer_ids if answer_id in answers),
+                key=lambda row: (row["created_at"], row["id"]),
+            )
+            if len(rows) < 2:
+                continue
+            groups.append({
+                "question_id": rows[0]["question_id"],
+                "question": rows[0]["question"],
+                "answers": [
+                    {
+                        "id": row["id"],
+                        "preview": row["preview"],
+                        "difficulty": row["difficulty"],
+                        "created_at": row["created_at"],
+                        "has_advice": bool(row["has_advice"]),
+                    }
+                    for row in rows
+                ],
+            })
+        
+        groups.sort(key=lambda group: (group["question_id"], group["answers"][0]["id"]))
+        return groups
+    
+    @_invalidates_cache
+    def merge_duplicate_answers(self, keep_answer_id: int, duplicate_answer_ids: Iterable[int]) -> int:
+        """
+        거의 같은 답변들을 하나로 합칩니다.
+        
+        남길 답변에 AI 조언이 없으면 중복 답변의 가장 최근 조언을 옮긴 뒤 중복 답변을 삭제합니다.
+        다른 질문의 답변은 삭제하지 않습니다.
+        
+        Args:
+            keep_answer_id: 남길 답변 ID
+            duplicate_answer_ids: 삭제할 중복 답변 ID 목록
+        
+        Returns:
+            삭제된 답변 수
+        """
+        duplicate_ids = [answer_id for answer_id in duplicate_answer_ids if answer_id != keep_answer_id]
+        if not duplicate_ids:
+            return 0
+        placeholders = ", ".join("?" * len(duplicate_ids))
+        
+        with self.pool.connection() as conn:
+            keep = conn.execute(
+                "SELECT question_id, advice FROM answers WHERE id = ?", (keep_answer_id,)
+            ).fetchone()
+            if keep is None:
+                return 0
+            
+            if keep["advice"] is None:
+                conn.execute(f'''
+                    UPDATE answers
+                    SET (advice, advice_at) = (
+                        SELECT advice, advice_at
+                        FROM answers
+                        WHERE id IN ({placeholders}) AND question_id = ? AND advice IS NOT NULL
+                        ORDER BY advice_at DESC
+                        LIMIT 1
+                    )
+                    WHERE id = ? AND EXISTS (
+                        SELECT 1 FROM answers
+                        WHERE id IN ({placeholders}) AND question_id = ? AND advice IS NOT NULL
+                    )
+                ''', duplicate_ids + [keep["question_id"], keep_answer_id] + duplicate_ids + [keep["question_id"]])
+            
+            cursor = conn.execute(f'''
+                DELETE FROM answers
+                WHERE id IN ({placeholders}) AND question_id = ?
+            ''', duplicate_ids + [keep["question_id"]])
+        
+        return cursor.rowcount
+    
+    @_invalidates_cache
+    def rebuild_question_stats(self) -> None:
+        """answers 테이블 전체로부터 질문별 통계 테이블을 다시 계산합니다."""
+        with self.pool.connection() as conn:
+            rebuild_question_stats(conn)
+    
+    @_invalidates_cache
+    def rebuild_answer_analytics(self) -> None:
+        """모든 답변을 다시 토큰화해 답변 분석 결과와 질문별/기간별 집계를 다시 계산합니다."""
+        with self.pool.connection() as conn:
+            rebuild_answer_analytics(conn)
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+# SM-2 기본/최소/최대 ease 값
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+MAX_EASE = 3.5
+
+# 두 번째 연속 성공 후의 복습 간격 (일)
+SECOND_INTERVAL_DAYS = 6.0
+
+# 최대 복습 간격 (일). 간격이 계속 곱해져 날짜 범위를 넘지 않도록 제한
+MAX_INTERVAL_DAYS = 3650.0
+
+# SQLite CURRENT_TIMESTAMP와 같은 형식 (UTC)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@dataclass
+class ReviewState:
+    """질문 하나의 복습 일정 상태"""
+
+    ease: float = DEFAULT_EASE
+    interval_days: float = 0.0
+    repetitions: int = 0
+
+
+def difficulty_to_quality(difficulty: int) -> int:
+    """난이도(1: 매우 쉬움 ~ 5: 매우 어려움)를 SM-2 응답 품질(5: 완벽 ~ 1: 매우 어려움)로 바꿉니다."""
+    return 6 - difficulty
+
+
+def schedule_review(state: ReviewState, difficulty: int) -> ReviewState:
+    """
+    SM-2 알고리즘으로 답변 후의 다음 복습 상태를 계산합니다.
+
+    난이도 4~5(어려움)는 실패로 보고 반복 횟수를 초기화해 다음 날 다시 복습하게 합니다.
+    ease는 MAX_EASE, 간격은 MAX_INTERVAL_DAYS를 넘지 않으므로 쉬운 답변이 계속 이어져도
+    복습 예정 시각을 계산할 수 있습니다.
+
+    >>> state = ReviewState()
+    >>> for _ in range(100):
+    ...     state = schedule_review(state, 1)
+    >>> state.interval_days == MAX_INTERVAL_DAYS, state.ease == MAX_EASE
+    (True, True)
+    >>> len(format_due_at(state.interval_days))
+    19
+
+    Args:
+        state: 현재 복습 상태
+        difficulty: 학생이 선택한 난이도 (1-5)
+
+    Returns:
+        다음 복습 상태
+    """
+    quality = difficulty_to_quality(difficulty)
+
+    if quality < 3:
+        repetitions = 0
+        interval_days = 1.0
+    else:
+        repetitions = state.repetitions + 1
+        if repetitions == 1:
+            interval_days = 1.0
+        elif repetitions == 2:
+            interval_days = SECOND_INTERVAL_DAYS
+        else:
+            interval_days = state.interval_days * state.ease
+
+    ease = state.ease + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    ease = min(MAX_EASE, max(MIN_EASE, ease))
+    interval_days = min(MAX_INTERVAL_DAYS, interval_days)
+
+    return ReviewState(ease=round(ease, 4), interval_days=round(interval_days, 4), repetitions=repetitions)
+
+
+def format_due_at(interval_days: float, now: Optional[datetime] = None) -> str:
+    """현재 시각에서 interval_days(최대 MAX_INTERVAL_DAYS) 뒤의 시각을 SQLite 타임스탬프 문자열로 반환합니다."""
+    now = now or datetime.now(timezone.utc)
+    return (now + timedelta(days=min(interval_days, MAX_INTERVAL_DAYS))).strftime(TIMESTAMP_FORMAT)
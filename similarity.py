@@ -0,0 +1,81 @@
+import hashlib
+import re
+import struct
+from typing import List, Optional
+
+# MinHash 서명 길이 (해시 함수 수) = LSH 밴드 수 × 밴드당 행 수
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+# 단어 n-gram 슁글 크기
+SHINGLE_SIZE = 3
+
+# 이 값 이상이면 거의 같은 답변으로 판단 (추정 Jaccard 유사도)
+DUPLICATE_THRESHOLD = 0.7
+
+# blake2b 한 번(64바이트)으로 64비트 해시 8개를 얻으므로, 키를 바꿔 8번 계산해 64개를 만듦
+_HASHES_PER_DIGEST = 8
+_DIGEST_KEYS = [f"minhash-{i}".encode() for i in range(NUM_PERMUTATIONS // _HASHES_PER_DIGEST)]
+_DIGEST_FORMAT = f"<{_HASHES_PER_DIGEST}Q"
+_SIGNATURE_FORMAT = f"<{NUM_PERMUTATIONS}Q"
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def shingles(text: str) -> set:
+    """대소문자와 구두점을 무시한 단어 n-gram 집합을 반환합니다."""
+    words = _TOKEN_PATTERN.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def minhash_signature(text: str) -> Optional[List[int]]:
+    """
+    답변의 MinHash 서명을 계산합니다.
+
+    두 서명에서 같은 위치의 값이 일치하는 비율이 슁글 집합의 Jaccard 유사도 추정치가 됩니다.
+
+    Returns:
+        NUM_PERMUTATIONS개의 64비트 정수 목록 (단어가 없으면 None)
+    """
+    shingle_set = shingles(text)
+    if not shingle_set:
+        return None
+
+    hashes = []
+    for shingle in shingle_set:
+        data = shingle.encode("utf-8")
+        values = []
+        for key in _DIGEST_KEYS:
+            digest = hashlib.blake2b(data, digest_size=64, key=key).digest()
+            values.extend(struct.unpack(_DIGEST_FORMAT, digest))
+        hashes.append(values)
+
+    return list(map(min, zip(*hashes)))
+
+
+def band_buckets(signature: List[int]) -> List[int]:
+    """서명을 LSH_BANDS개의 밴드로 나눠 밴드별 버킷 값(부호 있는 64비트 정수)을 반환합니다."""
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(struct.pack(f"<{LSH_ROWS}Q", *rows), digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, "little", signed=True))
+    return buckets
+
+
+def estimate_similarity(signature_a: List[int], signature_b: List[int]) -> float:
+    """두 MinHash 서명으로 Jaccard 유사도를 추정합니다."""
+    return sum(1 for a, b in zip(signature_a, signature_b) if a == b) / NUM_PERMUTATIONS
+
+
+def pack_signature(signature: List[int]) -> bytes:
+    """MinHash 서명을 answer_minhash.signature에 저장할 바이트열(리틀 엔디언 64비트 정수)로 바꿉니다."""
+    return struct.pack(_SIGNATURE_FORMAT, *signature)
+
+
+def unpack_signature(blob: bytes) -> List[int]:
+    """pack_signature로 저장한 바이트열을 MinHash 서명으로 되돌립니다."""
+    return list(struct.unpack(_SIGNATURE_FORMAT, blob))